@@ -0,0 +1,52 @@
+"""Shared pytest fixtures."""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from src.db.models import Base, Bot, User
+from src.telegram_handlers.base_handler import BaseHandler
+
+
+@pytest.fixture(autouse=True)
+def clear_handler_caches():
+    """BaseHandler caches are class-level; start every test empty."""
+    for cache in (BaseHandler._auth_cache, BaseHandler._last_cb, BaseHandler._msg_hash):
+        cache.clear()
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    """Session factory bound to a fresh SQLite database with all tables."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def add_bot(session_factory):
+    """Insert a bot (and its owner, on first use) and return its ID."""
+    async def add(user_id: int = 1, status: str = "stopped", **fields) -> int:
+        async with session_factory() as session:
+            if await session.get(User, user_id) is None:
+                session.add(User(id=user_id, username=f"user{user_id}", status="approved"))
+            
+            bot = Bot(
+                user_id=user_id,
+                name=fields.pop("name", "Test Bot"),
+                status=status,
+                token_encrypted="token",
+                folder="/tmp/bot",
+                remaining_seconds=fields.pop("remaining_seconds", 3600),
+                power_remaining=fields.pop("power_remaining", 50.0),
+                **fields,
+            )
+            session.add(bot)
+            await session.commit()
+            return bot.id
+    
+    return add
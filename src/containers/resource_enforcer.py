@@ -1,6 +1,7 @@
 """Resource enforcement and power drain calculation."""
 
 from datetime import datetime
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -53,8 +54,8 @@ class ResourceEnforcer:
             if not bot or bot.status != 'running':
                 return 0.0
             
-            # Get container stats
-            stats = self.container_mgr.get_container_stats(bot_id)
+            # Get container stats (blocking Docker SDK call, run in a thread)
+            stats = await asyncio.to_thread(self.container_mgr.get_container_stats, bot_id)
             cpu_percent = stats.get('cpu_percent', 0)
             
             # Calculate drain
@@ -125,7 +126,7 @@ class ResourceEnforcer:
                 await self.db.commit()
                 
                 # Stop container
-                self.container_mgr.stop_bot_container(bot_id)
+                await asyncio.to_thread(self.container_mgr.stop_bot_container, bot_id)
                 
                 logger.info(f"Bot {bot_id} put to sleep: resources depleted")
                 return True
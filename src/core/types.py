@@ -8,7 +8,7 @@ class UserData(TypedDict):
     """User database record."""
     id: int
     username: str
-    status: Literal["pending", "approved", "blocked"]
+    status: Literal["pending", "approved", "rejected", "blocked"]
     plan: Literal["free", "pro", "ultra"]
     joined_at: datetime
     approved_at: Optional[datetime]
@@ -19,7 +19,7 @@ class BotData(TypedDict):
     id: int
     user_id: int
     name: str
-    status: Literal["stopped", "running", "sleeping"]
+    status: Literal["stopped", "starting", "running", "stopping", "sleeping"]
     token_encrypted: str
     created_at: datetime
     
@@ -2,7 +2,7 @@
 
 from src.db.connection import DatabaseConnection
 from src.db.models import User, Bot, ErrorLog, AuditLog, Deployment, Base
-from src.db.repository import UserRepository, BotRepository, AuditLogRepository
+from src.db.repository import UserRepository, BotRepository, AuditLogRepository, gather_queries
 
 __all__ = [
     "DatabaseConnection",
@@ -15,4 +15,5 @@ __all__ = [
     "UserRepository",
     "BotRepository",
     "AuditLogRepository",
+    "gather_queries",
 ]
@@ -17,7 +17,7 @@ class User(Base):
     
     id = Column(Integer, primary_key=True)
     username = Column(String(32), unique=True, nullable=False, index=True)
-    status = Column(String(20), default='pending', index=True)  # pending, approved, blocked
+    status = Column(String(20), default='pending', index=True)  # pending, approved, rejected, blocked
     plan = Column(String(20), default='free')  # free, pro, ultra
     joined_at = Column(DateTime, default=datetime.utcnow)
     approved_at = Column(DateTime, nullable=True)
@@ -37,7 +37,7 @@ class Bot(Base):
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(100), nullable=False)
-    status = Column(String(20), default='stopped', index=True)  # stopped, running, sleeping
+    status = Column(String(20), default='stopped', index=True)  # stopped, starting, running, stopping, sleeping
     token_encrypted = Column(String(1024), nullable=False)  # Fernet encrypted
     created_at = Column(DateTime, default=datetime.utcnow)
     
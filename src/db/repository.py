@@ -1,5 +1,8 @@
 """Data access layer using repository pattern."""
 
+import asyncio
+from functools import partial
+from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func
 from datetime import datetime, timedelta
@@ -8,6 +11,35 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+async def gather_queries(*calls: Optional[partial]) -> list:
+    """
+    Await repository calls, concurrently where their sessions allow.
+    
+    An AsyncSession runs one statement at a time, so calls on the same
+    session run in order while calls on different sessions run together.
+    Each coroutine is created only when it is about to be awaited.
+    
+    Args:
+        *calls: functools.partial of bound repository methods; None entries
+            are skipped and yield None
+    
+    Returns:
+        Results in the order of calls
+    """
+    results = [None] * len(calls)
+    by_session = {}
+    for i, call in enumerate(calls):
+        if call is not None:
+            by_session.setdefault(id(call.func.__self__.session), []).append(i)
+    
+    async def run_in_order(indexes):
+        for i in indexes:
+            results[i] = await calls[i]()
+    
+    await asyncio.gather(*(run_in_order(indexes) for indexes in by_session.values()))
+    return results
+
+
 class UserRepository:
     """Data access for users."""
     
@@ -41,12 +73,29 @@ class UserRepository:
         await self.session.commit()
         return user
     
-    async def update_status(self, user_id: int, status: str):
-        """Update user status."""
+    async def update_status(self, user_id: int, status: str, plan: str = None,
+                            reason: str = None):
+        """
+        Update user status, plus plan/reason when given, in one statement.
+        
+        Args:
+            user_id: User ID
+            status: pending, approved, rejected, blocked
+            plan: Plan to assign (free, pro, ultra)
+            reason: Block/rejection reason
+        """
         from src.db.models import User
         
+        values = {"status": status}
+        if status == "approved":
+            values["approved_at"] = datetime.utcnow()
+        if plan is not None:
+            values["plan"] = plan
+        if reason is not None:
+            values["blocked_reason"] = reason
+        
         await self.session.execute(
-            update(User).where(User.id == user_id).values(status=status)
+            update(User).where(User.id == user_id).values(**values)
         )
         await self.session.commit()
     
@@ -58,6 +107,15 @@ class UserRepository:
             select(User).where(User.status == 'pending').limit(limit)
         )
         return result.scalars().all()
+    
+    async def get_approved_user_ids(self):
+        """Get IDs of all approved users (IDs only, no row hydration)."""
+        from src.db.models import User
+        
+        result = await self.session.execute(
+            select(User.id).where(User.status == 'approved')
+        )
+        return result.scalars().all()
 
 
 class BotRepository:
@@ -75,15 +133,68 @@ class BotRepository:
         )
         return result.scalars().first()
     
-    async def get_user_bots(self, user_id: int):
-        """Get all bots for user."""
+    async def get_with_permission(self, user_id: int, bot_id: int):
+        """
+        Get bot and whether user owns it, in one query.
+        
+        Returns:
+            (bot or None, allowed) tuple
+        """
+        bot = await self.get_by_id(bot_id)
+        return bot, bot is not None and bot.user_id == user_id
+    
+    async def get_user_bots(self, user_id: int, limit: int = None, offset: int = 0):
+        """Get bots for user, ordered by ID; limit/offset select a page."""
         from src.db.models import Bot
         
         result = await self.session.execute(
-            select(Bot).where(Bot.user_id == user_id)
+            select(Bot)
+            .where(Bot.user_id == user_id)
+            .order_by(Bot.id)
+            .limit(limit)
+            .offset(offset)
         )
         return result.scalars().all()
     
+    async def get_user_bot_summaries(self, user_id: int, limit: int = None, offset: int = 0):
+        """
+        Get lightweight rows for listing user's bots.
+        
+        Selects only id, name, status and remaining_seconds and returns
+        plain Row tuples (attribute access still works) instead of full ORM
+        instances, so no identity-map state is kept per bot.
+        """
+        from src.db.models import Bot
+        
+        result = await self.session.execute(
+            select(Bot.id, Bot.name, Bot.status, Bot.remaining_seconds)
+            .where(Bot.user_id == user_id)
+            .order_by(Bot.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        return result.all()
+    
+    async def count_user_bots(self, user_id: int) -> int:
+        """Get number of bots owned by user."""
+        from src.db.models import Bot
+        
+        result = await self.session.execute(
+            select(func.count()).select_from(Bot).where(Bot.user_id == user_id)
+        )
+        return result.scalar_one()
+    
+    async def get_status_counts(self, user_id: int) -> dict:
+        """Get number of user's bots per status, e.g. {"running": 2}."""
+        from src.db.models import Bot
+        
+        result = await self.session.execute(
+            select(Bot.status, func.count())
+            .where(Bot.user_id == user_id)
+            .group_by(Bot.status)
+        )
+        return dict(result.all())
+    
     async def get_running_bots(self):
         """Get all running bots."""
         from src.db.models import Bot
@@ -133,6 +244,71 @@ class BotRepository:
         )
         await self.session.commit()
     
+    async def reserve_for_start(self, bot_id: int, user_id: int):
+        """
+        Atomically claim an owned, startable bot by setting it to 'starting'.
+        
+        Returns:
+            Updated bot, or None if not found, not owned, already
+            starting/running/stopping, or out of time/power
+        """
+        from src.db.models import Bot
+        
+        result = await self.session.execute(
+            update(Bot)
+            .where(
+                Bot.id == bot_id,
+                Bot.user_id == user_id,
+                Bot.status.notin_(("starting", "running", "stopping")),
+                Bot.remaining_seconds > 0,
+                Bot.power_remaining > 0,
+            )
+            .values(status="starting")
+            .returning(Bot)
+        )
+        bot = result.scalars().first()
+        await self.session.commit()
+        return bot
+    
+    async def mark_running(self, bot_id: int, container_id: str = None) -> bool:
+        """
+        Finish a start by moving the bot from 'starting' to 'running'.
+        
+        Returns:
+            False if the bot is no longer 'starting' (e.g. deleted mid-start)
+        """
+        from src.db.models import Bot
+        
+        result = await self.session.execute(
+            update(Bot)
+            .where(Bot.id == bot_id, Bot.status == "starting")
+            .values(status="running", container_id=container_id)
+            .returning(Bot.id)
+        )
+        marked = result.first() is not None
+        await self.session.commit()
+        return marked
+    
+    async def reserve_for_stop(self, bot_id: int, user_id: int):
+        """
+        Atomically claim an owned, running bot by setting it to 'stopping'.
+        
+        Returns:
+            Updated bot (container_id still set), or None if not found,
+            not owned, or not running
+        """
+        from src.db.models import Bot
+        
+        result = await self.session.execute(
+            update(Bot)
+            .where(Bot.id == bot_id, Bot.user_id == user_id, Bot.status == "running")
+            .values(status="stopping")
+            .returning(Bot)
+        )
+        bot = result.scalars().first()
+        await self.session.commit()
+        return bot
+    
     async def update_resources(
         self,
         bot_id: int,
@@ -175,6 +351,24 @@ class BotRepository:
             delete(Bot).where(Bot.id == bot_id)
         )
         await self.session.commit()
+    
+    async def delete_owned(self, bot_id: int, user_id: int):
+        """
+        Delete bot if owned by user.
+        
+        Returns:
+            Row with the deleted bot's status and container_id, or None
+        """
+        from src.db.models import Bot
+        
+        result = await self.session.execute(
+            delete(Bot)
+            .where(Bot.id == bot_id, Bot.user_id == user_id)
+            .returning(Bot.status, Bot.container_id)
+        )
+        row = result.first()
+        await self.session.commit()
+        return row
 
 
 class AuditLogRepository:
@@ -1,7 +1,9 @@
 """Immutable audit logging to PostgreSQL."""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 from datetime import datetime
+import asyncio
+import contextlib
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,16 +14,31 @@ class AuditLogger:
     Immutable audit trail (INSERT only, NEVER DELETE/UPDATE).
     
     Records all security-relevant actions for compliance and debugging.
+    
+    Non-critical actions can be queued with enqueue() / log_action(); a
+    background task writes them in batches. Call close() on shutdown to
+    flush the queue.
+    
+    Every write opens its own session from the factory, so audit commits
+    never run on (or commit/roll back) a request's session.
     """
     
-    def __init__(self, db_session):
+    BATCH_SIZE = 50  # Max records per batched INSERT
+    FLUSH_INTERVAL = 0.5  # Max seconds a partial batch waits for more records
+    QUEUE_MAXSIZE = 10000  # Records beyond this are dropped (see dropped)
+    
+    def __init__(self, session_factory):
         """
         Initialize audit logger.
         
         Args:
-            db_session: SQLAlchemy async session
+            session_factory: SQLAlchemy async_sessionmaker
+                (e.g. DatabaseConnection.SessionLocal)
         """
-        self.db = db_session
+        self.session_factory = session_factory
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_MAXSIZE)
+        self._flusher_task: Optional[asyncio.Task] = None
+        self.dropped = 0  # Records lost because the queue was full
     
     async def log(
         self,
@@ -73,8 +90,9 @@ class AuditLogger:
                 created_at=datetime.utcnow()
             )
             
-            self.db.add(log_entry)
-            await self.db.commit()
+            async with self.session_factory() as session:
+                session.add(log_entry)
+                await session.commit()
             
             logger.info(
                 f"AUDIT: {action} | user={user_id} | status={status} | "
@@ -88,3 +106,135 @@ class AuditLogger:
             logger.critical(
                 f"AUDIT_FAILURE: Could not log {action} for user {user_id}: {e}"
             )
+    
+    def enqueue(
+        self,
+        user_id: int,
+        action: str,
+        status: str,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[Union[int, str]] = None,
+        error_code: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+    ) -> None:
+        """
+        Queue action for a batched background write (non-blocking).
+        
+        Takes the same arguments as log(); resource_id may be passed as an
+        int and is stringified at write time. Must be called from a running
+        event loop; the flusher task is started on first use.
+        """
+        try:
+            self._queue.put_nowait({
+                "user_id": user_id,
+                "action": action,
+                "status": status,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "error_code": error_code,
+                "ip_address": ip_address,
+                "details": details or {},
+                "created_at": datetime.utcnow(),
+            })
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.critical(
+                "AUDIT_DROPPED: queue full, lost %s for user %s (%d dropped)",
+                action, user_id, self.dropped
+            )
+            return
+        
+        if self._flusher_task is None:
+            self._flusher_task = asyncio.create_task(self._flusher())
+        
+        logger.info(
+            "AUDIT: %s | user=%s | status=%s | resource=%s:%s",
+            action, user_id, status, resource_type, resource_id
+        )
+    
+    def log_action(
+        self,
+        user_id: int,
+        action: str,
+        status: str,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[Union[int, str]] = None,
+        error_code: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+    ) -> None:
+        """Queue action for the audit trail; returns after an O(1) enqueue."""
+        self.enqueue(
+            user_id=user_id,
+            action=action,
+            status=status,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            error_code=error_code,
+            details=details,
+            ip_address=ip_address,
+        )
+    
+    async def close(self) -> None:
+        """Flush queued records and stop the background flusher."""
+        if self._flusher_task is None:
+            return
+        
+        await self._queue.join()
+        self._flusher_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._flusher_task
+        self._flusher_task = None
+    
+    async def _flusher(self) -> None:
+        """
+        Drain the queue, writing a batch once BATCH_SIZE records are
+        collected or FLUSH_INTERVAL has passed since the first one.
+        """
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.FLUSH_INTERVAL
+            
+            while len(batch) < self.BATCH_SIZE:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            await self._write_batch(batch)
+            
+            for _ in batch:
+                self._queue.task_done()
+    
+    async def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert a batch of queued records as one multi-row INSERT."""
+        try:
+            from sqlalchemy import insert
+            from src.db.models import AuditLog as AuditLogModel
+            
+            for record in batch:
+                resource_id = record["resource_id"]
+                record["resource_id"] = str(resource_id) if resource_id else None
+            
+            # Single INSERT ... VALUES (...), (...) round trip, bypassing the
+            # per-object unit of work that add_all() would go through
+            async with self.session_factory() as session:
+                await session.execute(insert(AuditLogModel).values(batch))
+                await session.commit()
+        
+        except Exception as e:
+            # Don't raise - audit failure shouldn't break the flusher.
+            # Leaving the session block rolls back the failed batch.
+            logger.critical(
+                "AUDIT_FAILURE: Could not write %d audit records: %s", len(batch), e
+            )
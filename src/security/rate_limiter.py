@@ -2,6 +2,7 @@
 
 from typing import Tuple
 import redis
+import redis.asyncio as aioredis
 from datetime import datetime
 import logging
 
@@ -15,12 +16,13 @@ class RateLimiter:
     Prevents UI spam, brute force, and resource exhaustion.
     """
     
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(self, redis_client: aioredis.Redis):
         """
         Initialize rate limiter.
         
         Args:
-            redis_client: Connected Redis client
+            redis_client: Connected asyncio Redis client (redis.asyncio.Redis),
+                so concurrent checks never block the event loop
         """
         self.redis = redis_client
     
@@ -56,10 +58,10 @@ class RateLimiter:
         window_key = f"ratelimit:{key}:{int(now.timestamp()) // window_seconds}"
         
         try:
-            pipe = self.redis.pipeline()
-            pipe.incr(window_key)
-            pipe.expire(window_key, window_seconds * 2)
-            results = pipe.execute()
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.incr(window_key)
+                pipe.expire(window_key, window_seconds * 2)
+                results = await pipe.execute()
             
             current_count = results[0]
             
@@ -2,9 +2,19 @@
 
 import aiohttp
 import asyncio
-from typing import Tuple
+import hashlib
+import os
+import socket
+import time
+from typing import Dict, Optional, Tuple
 import logging
 
+try:
+    import aiodns  # noqa: F401 - enables aiohttp.AsyncResolver
+    HAS_AIODNS = True
+except ImportError:
+    HAS_AIODNS = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,6 +27,36 @@ class TelegramTokenValidator:
     
     TELEGRAM_API_BASE = "https://api.telegram.org"
     VALIDATION_TIMEOUT = 5  # seconds
+    CACHE_TTL = 300  # seconds a rejected token stays rejected without asking again
+    CACHE_MAX_ENTRIES = 1024
+    DNS_CACHE_TTL = 300  # seconds
+    
+    def __init__(self):
+        """Initialize validator with an empty result cache."""
+        # Per-process key: cache keys are keyed BLAKE2b digests, so plaintext
+        # tokens are never retained and digests can't be mapped back to them
+        self._key = os.urandom(32)
+        self._cache: Dict[bytes, Tuple[float, str]] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get shared HTTP session (created on first use)."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+                use_dns_cache=True,
+                family=socket.AF_INET,
+                limit_per_host=8,
+                resolver=aiohttp.AsyncResolver() if HAS_AIODNS else None,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def close(self) -> None:
+        """Close shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def validate_token(self, token: str) -> Tuple[bool, str]:
         """
@@ -42,32 +82,37 @@ class TelegramTokenValidator:
         if ':' not in token:
             return False, "Invalid token format (missing colon)"
         
+        cache_key = self._cache_key(token)
+        cached = self._cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return False, cached[1]
+        
         try:
             url = f"{self.TELEGRAM_API_BASE}/bot{token}/getMe"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=self.VALIDATION_TIMEOUT)
-                ) as resp:
-                    
-                    if resp.status != 200:
-                        return False, f"Telegram API error: HTTP {resp.status}"
-                    
-                    data = await resp.json()
-                    
-                    if not data.get("ok"):
-                        error = data.get("description", "Unknown error")
-                        return False, f"Invalid token: {error}"
-                    
-                    result = data.get("result")
-                    if not result or not result.get("is_bot"):
-                        return False, "Token is valid but not a bot"
-                    
-                    # Success
-                    bot_username = result.get("username", "unknown")
-                    logger.info(f"Token validated for bot @{bot_username}")
-                    return True, ""
+            async with self._get_session().get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=self.VALIDATION_TIMEOUT)
+            ) as resp:
+                
+                if resp.status != 200:
+                    return False, f"Telegram API error: HTTP {resp.status}"
+                
+                data = await resp.json()
+                
+                if not data.get("ok"):
+                    error = data.get("description", "Unknown error")
+                    return self._reject(cache_key, f"Invalid token: {error}")
+                
+                result = data.get("result")
+                if not result or not result.get("is_bot"):
+                    return self._reject(cache_key, "Token is valid but not a bot")
+                
+                # Success is not cached, so a revoked or rotated token is
+                # caught on the next call
+                bot_username = result.get("username", "unknown")
+                logger.info(f"Token validated for bot @{bot_username}")
+                return True, ""
         
         except asyncio.TimeoutError:
             return False, "Telegram API timeout - please try again"
@@ -76,3 +121,28 @@ class TelegramTokenValidator:
         except Exception as e:
             logger.exception(f"Token validation error: {e}")
             return False, "Validation error - please try again later"
+    
+    def _cache_key(self, token: str) -> bytes:
+        """Derive a non-reversible cache key from token."""
+        return hashlib.blake2b(
+            token.encode("utf-8"), digest_size=16, key=self._key
+        ).digest()
+    
+    def _reject(self, cache_key: bytes, message: str) -> Tuple[bool, str]:
+        """
+        Cache a definitive rejection from the Telegram API and return it.
+        
+        Only rejections are cached: re-submitting the same bad token within
+        CACHE_TTL seconds is answered locally. Accepted tokens are always
+        re-checked, so the cache never vouches for a token Telegram has
+        since revoked.
+        """
+        now = time.monotonic()
+        
+        if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+            self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+            if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                self._cache.clear()
+        
+        self._cache[cache_key] = (now + self.CACHE_TTL, message)
+        return False, message
@@ -5,6 +5,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns. Atomic groups (Python 3.11+) stop backtracking into
+# already-matched runs, keeping matching linear on adversarial input.
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]{5,32}$')
+_BOT_NAME_RE = re.compile(r'^[a-zA-Z0-9\s_-]+$')
+_GITHUB_RE = re.compile(r'^https://github\.com/(?>[a-zA-Z0-9_-]+)/(?>[a-zA-Z0-9_.-]+)$')
+_TOKEN_RE = re.compile(r'(?>[0-9]{8,10}):(?>[a-zA-Z0-9_-]{35})')
+
 
 class InputValidator:
     """Validate and sanitize user input."""
@@ -27,8 +34,7 @@ class InputValidator:
         username = username.lstrip('@')
         
         # Telegram usernames: 5-32 characters, alphanumeric and underscores
-        pattern = r'^[a-zA-Z0-9_]{5,32}$'
-        return bool(re.match(pattern, username))
+        return bool(_USERNAME_RE.match(username))
     
     @staticmethod
     def validate_bot_name(name: str) -> bool:
@@ -45,8 +51,7 @@ class InputValidator:
             return False
         
         # Allow alphanumeric, spaces, hyphens, underscores
-        pattern = r'^[a-zA-Z0-9\s_-]+$'
-        return bool(re.match(pattern, name))
+        return bool(_BOT_NAME_RE.match(name))
     
     @staticmethod
     def validate_bot_id(bot_id: str) -> bool:
@@ -114,8 +119,7 @@ class InputValidator:
         Returns:
             True if valid GitHub URL
         """
-        pattern = r'^https://github\.com/[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+$'
-        return bool(re.match(pattern, url))
+        return bool(_GITHUB_RE.match(url))
     
     @staticmethod
     def extract_bot_token(code: str) -> str:
@@ -129,7 +133,6 @@ class InputValidator:
             Token string or empty string
         """
         # Telegram token format: digits:alphanumeric-_
-        pattern = r'[0-9]{8,10}:[a-zA-Z0-9_-]{35}'
-        match = re.search(pattern, code)
+        match = _TOKEN_RE.search(code)
         
         return match.group(0) if match else ""
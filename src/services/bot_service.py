@@ -1,11 +1,15 @@
 """Bot service for bot management and lifecycle."""
 
+import asyncio
 import logging
 from typing import Optional
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Statuses in which a container may exist (or be coming up / going down)
+_ACTIVE_STATUSES = ("starting", "running", "stopping")
+
 
 class BotService:
     """Handle bot-related business logic."""
@@ -69,16 +73,16 @@ class BotService:
             )
             
             if self.audit_logger:
-                await self.audit_logger.log_action(
+                self.audit_logger.enqueue(
                     user_id=user_id,
                     action="bot.created",
                     resource_type="bot",
-                    resource_id=str(bot.id),
+                    resource_id=bot.id,
                     status="success",
                     details={"name": name, "plan": plan}
                 )
             
-            logger.info(f"Created bot {bot.id} for user {user_id}")
+            logger.info("Created bot %s for user %s", bot.id, user_id)
             
             return {
                 "success": True,
@@ -90,7 +94,7 @@ class BotService:
             }
         
         except Exception as e:
-            logger.error(f"Error creating bot: {e}")
+            logger.error("Error creating bot: %s", e)
             return {"success": False, "error": str(e)}
     
     async def start_bot(self, bot_id: int, user_id: int) -> dict:
@@ -105,61 +109,60 @@ class BotService:
             Success dict
         """
         try:
-            # Get bot
-            bot = await self.bot_repo.get_by_id(bot_id)
+            # Atomically claim the bot (ownership + resource checks in one UPDATE)
+            bot = await self.bot_repo.reserve_for_start(bot_id, user_id)
             
             if not bot:
-                return {"success": False, "error": "Bot not found"}
-            
-            if bot.user_id != user_id:
-                return {"success": False, "error": "Permission denied"}
-            
-            # Check resources
-            if bot.remaining_seconds <= 0:
-                return {"success": False, "error": "No time remaining"}
-            
-            if bot.power_remaining <= 0:
-                return {"success": False, "error": "No power remaining"}
-            
-            # Decrypt token
-            if self.secrets_manager:
-                token = self.secrets_manager.decrypt_token(bot.token_encrypted)
-            else:
-                token = bot.token_encrypted
-            
-            # Launch container
-            if self.container_manager:
-                try:
-                    container_id = await self.container_manager.launch_bot_container(
+                return {"success": False, "error": await self._start_denied_reason(bot_id, user_id)}
+            
+            container_id = None
+            started = False
+            try:
+                # Decrypt token
+                if self.secrets_manager:
+                    token = self.secrets_manager.decrypt_token(bot.token_encrypted)
+                else:
+                    token = bot.token_encrypted
+                
+                # Launch container (skipped when testing without Docker)
+                if self.container_manager:
+                    container_id = await asyncio.to_thread(
+                        self.container_manager.launch_bot_container,
                         bot_id=bot_id,
-                        token=token,
-                        time_limit=bot.remaining_seconds
+                        bot_token=token,
+                        timeout_seconds=bot.remaining_seconds
                     )
-                    
-                    # Update bot status
-                    await self.bot_repo.update_status(bot_id, "running", container_id)
                 
-                except Exception as e:
-                    logger.error(f"Container launch error: {e}")
-                    return {"success": False, "error": f"Container error: {str(e)[:50]}"}
-            else:
-                # For testing without Docker
-                await self.bot_repo.update_status(bot_id, "running")
+                # Only a bot still in 'starting' becomes running; if it was
+                # deleted meanwhile, the finally block stops the container
+                if not await self.bot_repo.mark_running(bot_id, container_id):
+                    return {"success": False, "error": "Bot was deleted while starting"}
+                started = True
+            
+            except Exception as e:
+                logger.error("Container launch error: %s", e)
+                return {"success": False, "error": f"Container error: {str(e)[:50]}"}
+            
+            finally:
+                # Release the claim on any failure (including cancellation)
+                # so the bot isn't left in 'starting' forever
+                if not started:
+                    await self._release_start(bot_id, container_id)
             
             if self.audit_logger:
-                await self.audit_logger.log_action(
+                self.audit_logger.enqueue(
                     user_id=user_id,
                     action="bot.started",
                     resource_type="bot",
-                    resource_id=str(bot_id),
+                    resource_id=bot_id,
                     status="success"
                 )
             
-            logger.info(f"Started bot {bot_id}")
+            logger.info("Started bot %s", bot_id)
             return {"success": True, "bot_id": bot_id}
         
         except Exception as e:
-            logger.error(f"Error starting bot {bot_id}: {e}")
+            logger.error("Error starting bot %s: %s", bot_id, e)
             return {"success": False, "error": str(e)}
     
     async def stop_bot(self, bot_id: int, user_id: int) -> dict:
@@ -174,39 +177,36 @@ class BotService:
             Success dict
         """
         try:
-            # Get bot
-            bot = await self.bot_repo.get_by_id(bot_id)
+            # Atomically claim the bot for stopping
+            bot = await self.bot_repo.reserve_for_stop(bot_id, user_id)
             
             if not bot:
-                return {"success": False, "error": "Bot not found"}
-            
-            if bot.user_id != user_id:
-                return {"success": False, "error": "Permission denied"}
+                return {"success": False, "error": await self._stop_denied_reason(bot_id, user_id)}
             
             # Stop container
             if self.container_manager and bot.container_id:
                 try:
-                    await self.container_manager.stop_container(bot.container_id)
+                    await asyncio.to_thread(self.container_manager.stop_bot_container, bot_id)
                 except Exception as e:
-                    logger.error(f"Error stopping container: {e}")
+                    logger.error("Error stopping container: %s", e)
             
             # Update status
             await self.bot_repo.update_status(bot_id, "stopped")
             
             if self.audit_logger:
-                await self.audit_logger.log_action(
+                self.audit_logger.enqueue(
                     user_id=user_id,
                     action="bot.stopped",
                     resource_type="bot",
-                    resource_id=str(bot_id),
+                    resource_id=bot_id,
                     status="success"
                 )
             
-            logger.info(f"Stopped bot {bot_id}")
+            logger.info("Stopped bot %s", bot_id)
             return {"success": True, "bot_id": bot_id}
         
         except Exception as e:
-            logger.error(f"Error stopping bot {bot_id}: {e}")
+            logger.error("Error stopping bot %s: %s", bot_id, e)
             return {"success": False, "error": str(e)}
     
     async def delete_bot(self, bot_id: int, user_id: int) -> dict:
@@ -221,41 +221,71 @@ class BotService:
             Success dict
         """
         try:
-            # Get bot
-            bot = await self.bot_repo.get_by_id(bot_id)
+            # Delete owned bot, returning its last state
+            bot = await self.bot_repo.delete_owned(bot_id, user_id)
             
             if not bot:
-                return {"success": False, "error": "Bot not found"}
-            
-            if bot.user_id != user_id:
-                return {"success": False, "error": "Permission denied"}
+                return {"success": False, "error": "Bot not found or permission denied"}
             
-            # Stop container if running
-            if bot.status == "running" and self.container_manager:
+            # Stop container if one may exist (mid-start and mid-stop included)
+            if bot.status in _ACTIVE_STATUSES and self.container_manager:
                 try:
-                    await self.container_manager.stop_container(bot.container_id)
+                    await asyncio.to_thread(self.container_manager.stop_bot_container, bot_id)
                 except Exception as e:
-                    logger.warning(f"Error stopping container during delete: {e}")
-            
-            # Delete bot
-            await self.bot_repo.delete(bot_id)
+                    logger.warning("Error stopping container during delete: %s", e)
             
             if self.audit_logger:
-                await self.audit_logger.log_action(
+                self.audit_logger.enqueue(
                     user_id=user_id,
                     action="bot.deleted",
                     resource_type="bot",
-                    resource_id=str(bot_id),
+                    resource_id=bot_id,
                     status="success"
                 )
             
-            logger.info(f"Deleted bot {bot_id}")
+            logger.info("Deleted bot %s", bot_id)
             return {"success": True}
         
         except Exception as e:
-            logger.error(f"Error deleting bot {bot_id}: {e}")
+            logger.error("Error deleting bot %s: %s", bot_id, e)
             return {"success": False, "error": str(e)}
     
+    async def _release_start(self, bot_id: int, container_id: Optional[str]) -> None:
+        """Undo a failed start: stop any launched container, mark bot stopped."""
+        if container_id and self.container_manager:
+            try:
+                await asyncio.to_thread(self.container_manager.stop_bot_container, bot_id)
+            except Exception as e:
+                logger.warning("Error stopping container after failed start: %s", e)
+        
+        await self.bot_repo.update_status(bot_id, "stopped")
+    
+    async def _start_denied_reason(self, bot_id: int, user_id: int) -> str:
+        """Explain why reserve_for_start() refused the bot (failure path only)."""
+        bot = await self.bot_repo.get_by_id(bot_id)
+        
+        if not bot:
+            return "Bot not found"
+        if bot.user_id != user_id:
+            return "Permission denied"
+        if bot.status in ("running", "starting"):
+            return "Bot is already running"
+        if bot.status == "stopping":
+            return "Bot is stopping"
+        if bot.remaining_seconds <= 0:
+            return "No time remaining"
+        return "No power remaining"
+    
+    async def _stop_denied_reason(self, bot_id: int, user_id: int) -> str:
+        """Explain why reserve_for_stop() refused the bot (failure path only)."""
+        bot = await self.bot_repo.get_by_id(bot_id)
+        
+        if not bot:
+            return "Bot not found"
+        if bot.user_id != user_id:
+            return "Permission denied"
+        return "Bot is not running"
+    
     async def add_time(self, bot_id: int, user_id: int, hours: int) -> dict:
         """
         Add hosting time to bot.
@@ -284,20 +314,20 @@ class BotService:
             )
             
             if self.audit_logger:
-                await self.audit_logger.log_action(
+                self.audit_logger.enqueue(
                     user_id=user_id,
                     action="bot.time_added",
                     resource_type="bot",
-                    resource_id=str(bot_id),
+                    resource_id=bot_id,
                     status="success",
                     details={"hours": hours}
                 )
             
-            logger.info(f"Added {hours}h to bot {bot_id}")
+            logger.info("Added %sh to bot %s", hours, bot_id)
             return {"success": True, "new_remaining": new_remaining}
         
         except Exception as e:
-            logger.error(f"Error adding time: {e}")
+            logger.error("Error adding time: %s", e)
             return {"success": False, "error": str(e)}
     
     async def add_power(self, bot_id: int, user_id: int, percentage: float) -> dict:
@@ -327,18 +357,18 @@ class BotService:
             )
             
             if self.audit_logger:
-                await self.audit_logger.log_action(
+                self.audit_logger.enqueue(
                     user_id=user_id,
                     action="bot.power_added",
                     resource_type="bot",
-                    resource_id=str(bot_id),
+                    resource_id=bot_id,
                     status="success",
                     details={"percentage": percentage}
                 )
             
-            logger.info(f"Added {percentage}% power to bot {bot_id}")
+            logger.info("Added %s%% power to bot %s", percentage, bot_id)
             return {"success": True, "new_power": new_power}
         
         except Exception as e:
-            logger.error(f"Error adding power: {e}")
+            logger.error("Error adding power: %s", e)
             return {"success": False, "error": str(e)}
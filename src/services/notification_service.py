@@ -1,20 +1,81 @@
 """Notification service for sending messages to users."""
 
+import asyncio
+import contextlib
 import logging
 from typing import List, Optional
 
+from telegram.error import RetryAfter
+
 logger = logging.getLogger(__name__)
 
+# Message templates (filled with str.format_map)
+_TPL_STARTED = "✅ Your bot '{name}' has started successfully!"
+_TPL_STOPPED = "⏹️ Your bot '{name}' has stopped."
+_TPL_ERROR = "🚨 Error with bot '{name}':\n{error}"
+_TPL_TIME_LOW = (
+    "⏳ Attention: Your bot '{name}' has only "
+    "`{hours}` hours of hosting time left!"
+)
+_TPL_POWER_LOW = (
+    "⚡ Warning: Your bot '{name}' power is low (`{power:.1f}%`).\n"
+    "It will enter sleep mode when power reaches 0%."
+)
+_TPL_SLEEP = "🛌 Your bot '{name}' entered sleep mode.\nReason: {reason}"
+_TPL_APPROVED = (
+    "🎉 Welcome! Your account has been approved!\n"
+    "Plan: `{plan}`\n\n"
+    "You can now upload and host your bots."
+)
+_TPL_REJECTED = "❌ Your account application was rejected."
+_TPL_REJECTED_REASON = _TPL_REJECTED + "\nReason: {reason}"
+
+
+class _SendPacer:
+    """
+    Spaces out message sends to at most `rate` per second.
+    
+    Callers await wait() before each send; pause() pushes every later slot
+    back, so one RetryAfter holds the whole broadcast, not just one send.
+    """
+    
+    def __init__(self, rate: float):
+        self._interval = 1 / rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def wait(self) -> None:
+        """Sleep until the next free send slot and claim it."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_slot - loop.time()
+            # Re-check after sleeping: a pause() meanwhile moves the slot back
+            while delay > 0:
+                await asyncio.sleep(delay)
+                delay = self._next_slot - loop.time()
+            self._next_slot = loop.time() + self._interval
+    
+    def pause(self, seconds: float) -> None:
+        """Hand out no slot for the next `seconds` (Telegram flood control)."""
+        resume_at = asyncio.get_running_loop().time() + seconds
+        self._next_slot = max(self._next_slot, resume_at)
+
 
 class NotificationService:
     """Handle sending notifications to users."""
     
+    BROADCAST_RATE = 25  # Max sends started per second (Telegram allows ~30 msg/s)
+    BROADCAST_CONCURRENCY = 25  # Max in-flight sends during broadcast
+    MAX_FLOOD_RETRIES = 3  # Times a send is retried after RetryAfter
+    
     def __init__(self, bot_application=None):
         """
         Initialize notification service.
         
         Args:
-            bot_application: Telegram Application instance for sending messages
+            bot_application: Telegram Application instance for sending messages.
+                Its request pool must be sized for broadcast concurrency
+                (see telegram_handlers.application.build_application).
         """
         self.bot_application = bot_application
     
@@ -27,90 +88,122 @@ class NotificationService:
             message: Message text
             parse_mode: Markdown or HTML
         
+        Returns:
+            Success status
+        """
+        return await self._send(user_id, message, parse_mode)
+    
+    async def _send(self, user_id: int, message: str, parse_mode: Optional[str],
+                    pacer: Optional[_SendPacer] = None,
+                    semaphore: Optional[asyncio.Semaphore] = None) -> bool:
+        """
+        Send one message, waiting out Telegram flood control (RetryAfter).
+        
+        Args:
+            user_id: Telegram user ID
+            message: Message text
+            parse_mode: Markdown, HTML or None
+            pacer: Shared broadcast pacer (rate limit + flood pauses)
+            semaphore: Shared bound on in-flight sends
+        
         Returns:
             Success status
         """
         if not self.bot_application:
-            logger.warning(f"Bot application not available for notification to {user_id}")
+            logger.warning("Bot application not available for notification to %s", user_id)
             return False
         
-        try:
-            await self.bot_application.bot.send_message(
-                chat_id=user_id,
-                text=message,
-                parse_mode=parse_mode
-            )
-            logger.info(f"Sent notification to user {user_id}")
-            return True
+        for attempt in range(self.MAX_FLOOD_RETRIES + 1):
+            if pacer:
+                await pacer.wait()
+            
+            try:
+                async with semaphore or contextlib.nullcontext():
+                    await self.bot_application.bot.send_message(
+                        chat_id=user_id,
+                        text=message,
+                        parse_mode=parse_mode
+                    )
+                logger.info("Sent notification to user %s", user_id)
+                return True
+            
+            except RetryAfter as e:
+                if attempt == self.MAX_FLOOD_RETRIES:
+                    break
+                logger.warning(
+                    "Flood control sending to %s, retrying in %ss", user_id, e.retry_after
+                )
+                if pacer:
+                    pacer.pause(e.retry_after)
+                else:
+                    await asyncio.sleep(e.retry_after)
+            
+            except Exception as e:
+                logger.error("Error sending notification to %s: %s", user_id, e)
+                return False
         
-        except Exception as e:
-            logger.error(f"Error sending notification to {user_id}: {e}")
-            return False
+        logger.error(
+            "Giving up on notification to %s after %d flood-control retries",
+            user_id, self.MAX_FLOOD_RETRIES
+        )
+        return False
     
     async def notify_bot_started(self, user_id: int, bot_name: str) -> bool:
         """Notify user that bot started."""
-        message = f"✅ Your bot '{bot_name}' has started successfully!"
-        return await self.notify_user(user_id, message)
+        return await self.notify_user(user_id, _TPL_STARTED.format_map({"name": bot_name}))
     
     async def notify_bot_stopped(self, user_id: int, bot_name: str) -> bool:
         """Notify user that bot stopped."""
-        message = f"⏹️ Your bot '{bot_name}' has stopped."
-        return await self.notify_user(user_id, message)
+        return await self.notify_user(user_id, _TPL_STOPPED.format_map({"name": bot_name}))
     
     async def notify_bot_error(self, user_id: int, bot_name: str, error: str) -> bool:
         """Notify user of bot error."""
-        message = f"🚨 Error with bot '{bot_name}':\n{error[:100]}"
+        message = _TPL_ERROR.format_map({"name": bot_name, "error": error[:100]})
         return await self.notify_user(user_id, message)
     
     async def notify_time_running_out(self, user_id: int, bot_name: str,
                                      hours_remaining: int) -> bool:
         """Notify user that hosting time is running out."""
-        message = (
-            f"⏳ Attention: Your bot '{bot_name}' has only "
-            f"`{hours_remaining}` hours of hosting time left!"
-        )
+        message = _TPL_TIME_LOW.format_map({"name": bot_name, "hours": hours_remaining})
         return await self.notify_user(user_id, message)
     
     async def notify_power_low(self, user_id: int, bot_name: str,
                              power_percent: float) -> bool:
         """Notify user that power is running low."""
-        message = (
-            f"⚡ Warning: Your bot '{bot_name}' power is low (`{power_percent:.1f}%`).\n"
-            f"It will enter sleep mode when power reaches 0%."
-        )
+        message = _TPL_POWER_LOW.format_map({"name": bot_name, "power": power_percent})
         return await self.notify_user(user_id, message)
     
     async def notify_sleep_mode(self, user_id: int, bot_name: str, reason: str) -> bool:
         """Notify user that bot entered sleep mode."""
-        message = f"🛌 Your bot '{bot_name}' entered sleep mode.\nReason: {reason}"
+        message = _TPL_SLEEP.format_map({"name": bot_name, "reason": reason})
         return await self.notify_user(user_id, message)
     
     async def notify_user_approved(self, user_id: int, plan: str) -> bool:
         """Notify user that account was approved."""
-        message = (
-            f"🎉 Welcome! Your account has been approved!\n"
-            f"Plan: `{plan}`\n\n"
-            f"You can now upload and host your bots."
-        )
-        return await self.notify_user(user_id, message)
+        return await self.notify_user(user_id, _TPL_APPROVED.format_map({"plan": plan}))
     
     async def notify_user_rejected(self, user_id: int, reason: Optional[str] = None) -> bool:
         """Notify user that account was rejected."""
-        message = "❌ Your account application was rejected."
         if reason:
-            message += f"\nReason: {reason}"
+            message = _TPL_REJECTED_REASON.format_map({"reason": reason})
+        else:
+            message = _TPL_REJECTED
         
         return await self.notify_user(user_id, message)
     
     async def broadcast(self, user_ids: List[int], message: str,
-                       parse_mode: str = "Markdown") -> dict:
+                       parse_mode: Optional[str] = "Markdown") -> dict:
         """
         Send message to multiple users.
         
+        Sends start at most BROADCAST_RATE per second with at most
+        BROADCAST_CONCURRENCY in flight; a RetryAfter pauses every send for
+        the requested time and the message is retried.
+        
         Args:
             user_ids: List of user IDs
             message: Message text
-            parse_mode: Markdown or HTML
+            parse_mode: Markdown, HTML or None for plain text
         
         Returns:
             Stats dict
@@ -122,12 +215,16 @@ class NotificationService:
             "errors": []
         }
         
-        for user_id in user_ids:
-            success = await self.notify_user(user_id, message, parse_mode)
-            if success:
-                results["sent"] += 1
-            else:
-                results["failed"] += 1
+        pacer = _SendPacer(self.BROADCAST_RATE)
+        semaphore = asyncio.Semaphore(self.BROADCAST_CONCURRENCY)
+        
+        # Concurrent sends share the Application's HTTP/2 connection
+        outcomes = await asyncio.gather(*(
+            self._send(user_id, message, parse_mode, pacer, semaphore)
+            for user_id in user_ids
+        ))
+        results["sent"] = sum(outcomes)
+        results["failed"] = results["total"] - results["sent"]
         
-        logger.info(f"Broadcast complete: {results['sent']}/{results['total']} sent")
+        logger.info("Broadcast complete: %s/%s sent", results["sent"], results["total"])
         return results
@@ -1,25 +1,43 @@
 """User service for user management."""
 
 import logging
-from typing import Optional, Literal
-from datetime import datetime
+from operator import attrgetter
+from typing import Callable, Optional, Literal
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+_PENDING_FIELDS = attrgetter("id", "username", "joined_at")
+
+
+def _epoch(dt: datetime) -> int:
+    """Convert a naive UTC datetime (as stored in the DB) to epoch seconds."""
+    return int(dt.replace(tzinfo=timezone.utc).timestamp())
+
 
 class UserService:
     """Handle user-related business logic."""
     
-    def __init__(self, user_repo, audit_logger=None):
+    def __init__(self, user_repo, audit_logger=None,
+                 invalidate_auth: Optional[Callable[[int], None]] = None):
         """
         Initialize user service.
         
         Args:
             user_repo: UserRepository instance
             audit_logger: AuditLogger instance
+            invalidate_auth: Called with a user ID after its status changes,
+                e.g. BaseHandler.invalidate to drop the cached auth status
         """
         self.user_repo = user_repo
         self.audit_logger = audit_logger
+        self.invalidate_auth = invalidate_auth
+    
+    async def _set_status(self, user_id: int, status: str, **fields) -> None:
+        """Update user status and drop any cached auth decision for them."""
+        await self.user_repo.update_status(user_id, status, **fields)
+        if self.invalidate_auth:
+            self.invalidate_auth(user_id)
     
     async def create_user(self, user_id: int, username: str) -> dict:
         """
@@ -36,7 +54,7 @@ class UserService:
             user = await self.user_repo.create(user_id, username, status="pending")
             
             if self.audit_logger:
-                await self.audit_logger.log_action(
+                self.audit_logger.log_action(
                     user_id=user_id,
                     action="user.created",
                     resource_type="user",
@@ -49,7 +67,7 @@ class UserService:
         except Exception as e:
             logger.error(f"Error creating user {user_id}: {e}")
             if self.audit_logger:
-                await self.audit_logger.log_action(
+                self.audit_logger.log_action(
                     user_id=user_id,
                     action="user.create_error",
                     resource_type="user",
@@ -72,13 +90,11 @@ class UserService:
             Success dict
         """
         try:
-            # Update user status
-            await self.user_repo.update_status(user_id, "approved")
-            
-            # TODO: Update plan in database
+            # Update user status and plan
+            await self._set_status(user_id, "approved", plan=plan)
             
             if self.audit_logger:
-                await self.audit_logger.log_action(
+                self.audit_logger.log_action(
                     user_id=approver_id,
                     action="user.approved",
                     resource_type="user",
@@ -107,10 +123,10 @@ class UserService:
             Success dict
         """
         try:
-            # TODO: Update user status and reason
+            await self._set_status(user_id, "rejected", reason=reason)
             
             if self.audit_logger:
-                await self.audit_logger.log_action(
+                self.audit_logger.log_action(
                     user_id=rejector_id,
                     action="user.rejected",
                     resource_type="user",
@@ -139,10 +155,10 @@ class UserService:
             Success dict
         """
         try:
-            # TODO: Update user status to blocked with reason
+            await self._set_status(user_id, "blocked", reason=reason)
             
             if self.audit_logger:
-                await self.audit_logger.log_action(
+                self.audit_logger.log_action(
                     user_id=blocker_id,
                     action="user.blocked",
                     resource_type="user",
@@ -181,7 +197,7 @@ class UserService:
                     "username": user.username,
                     "status": user.status,
                     "plan": user.plan,
-                    "joined_at": user.joined_at.isoformat(),
+                    "joined_at": _epoch(user.joined_at),
                 }
             }
         
@@ -207,11 +223,11 @@ class UserService:
                 "count": len(users),
                 "users": [
                     {
-                        "id": u.id,
-                        "username": u.username,
-                        "joined_at": u.joined_at.isoformat(),
+                        "id": user_id,
+                        "username": username,
+                        "joined_at": _epoch(joined_at),
                     }
-                    for u in users
+                    for user_id, username, joined_at in map(_PENDING_FIELDS, users)
                 ]
             }
         
@@ -4,6 +4,7 @@ from src.telegram_handlers.base_handler import BaseHandler, security_handler
 from src.telegram_handlers.user_handlers import UserHandlers
 from src.telegram_handlers.bot_management_handlers import BotManagementHandlers
 from src.telegram_handlers.admin_handlers import AdminHandlers
+from src.telegram_handlers.application import build_application
 
 __all__ = [
     "BaseHandler",
@@ -11,4 +12,5 @@ __all__ = [
     "UserHandlers",
     "BotManagementHandlers",
     "AdminHandlers",
+    "build_application",
 ]
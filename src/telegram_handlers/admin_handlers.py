@@ -1,114 +1,145 @@
 """Admin handlers for user approval, system stats, and management."""
 
+import html
 import logging
+import re
+import time
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 
+from src.services import NotificationService
 from src.telegram_handlers.base_handler import BaseHandler
 
 logger = logging.getLogger(__name__)
 
+# Seconds the pending-user list stays cached in context.user_data
+_PENDING_CACHE_TTL = 30
+
+# admin_<approve|reject>[_<plan>]_<user_id>
+_ADMIN_CB = re.compile(r"^admin_(approve|reject)(?:_(free|pro|ultra))?_(\d+)$")
+
+# Static message texts
+_ADMIN_PANEL_TEXT = "👑 <b>Admin Panel</b>\n\nSystem Management"
+_EMPTY_PENDING_TEXT = "👥 <b>Pending Users</b>\n\nNo pending users."
+_BROADCAST_USAGE_TEXT = "Usage: /broadcast <message>"
+_STATS_TMPL = (
+    "📊 <b>System Statistics</b>\n\n"
+    "👥 <b>Users</b>\n"
+    "• Total: <code>{total_users}</code>\n"
+    "• Approved: <code>{approved_users}</code>\n\n"
+    "🤖 <b>Bots</b>\n"
+    "• Total: <code>{total_bots}</code>\n"
+    "• Running: <code>{running_bots}</code>\n\n"
+    "💾 <b>Database</b>\n"
+    "• Status: <code>Connected</code>"
+)
+
+# Static keyboards (PTB telegram objects are immutable, safe to share)
+_BACK_ADMIN = (InlineKeyboardButton("🔙 Back", callback_data="admin_panel"),)
+_BACK_TO_ADMIN_KB = InlineKeyboardMarkup([_BACK_ADMIN])
+_ADMIN_PANEL_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("👥 Pending Users", callback_data="admin_pending")],
+    [InlineKeyboardButton("📊 System Stats", callback_data="admin_stats")],
+    [InlineKeyboardButton("🚨 Error Logs", callback_data="admin_errors")],
+    [InlineKeyboardButton("🔙 Back", callback_data="main_menu")]
+])
+
 
 class AdminHandlers(BaseHandler):
     """Handle admin-only commands and management."""
     
     async def admin_panel(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show admin control panel."""
-        user_id = update.effective_user.id
-        
-        # Check admin
-        if not await self.is_admin(user_id):
+        admin_id = self._admin_gate(update)
+        if admin_id is None:
             await update.callback_query.answer("❌ Admin only")
             return
         
-        keyboard = [
-            [InlineKeyboardButton("👥 Pending Users", callback_data="admin_pending")],
-            [InlineKeyboardButton("📊 System Stats", callback_data="admin_stats")],
-            [InlineKeyboardButton("🚨 Error Logs", callback_data="admin_errors")],
-            [InlineKeyboardButton("🔙 Back", callback_data="main_menu")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        await update.callback_query.edit_message_text(
-            "👑 *Admin Panel*\n\n"
-            "System Management",
-            reply_markup=reply_markup,
-            parse_mode="Markdown"
+        await self.safe_edit(
+            update.callback_query,
+            _ADMIN_PANEL_TEXT,
+            reply_markup=_ADMIN_PANEL_KB
         )
     
     async def pending_users(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
                            user_repo=None):
         """Show pending user approvals."""
-        user_id = update.effective_user.id
-        
-        # Check admin
-        if not await self.is_admin(user_id):
+        admin_id = self._admin_gate(update)
+        if admin_id is None:
             await update.callback_query.answer("❌ Admin only")
             return
         
         # Get pending users
         pending = []
+        user_repo = user_repo or self.user_repo
         if user_repo:
             pending = await user_repo.get_pending_users(limit=50)
         
         if not pending:
-            keyboard = [
-                [InlineKeyboardButton("🔙 Back", callback_data="admin_panel")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await update.callback_query.edit_message_text(
-                "👥 *Pending Users*\n\n"
-                "No pending users.",
-                reply_markup=reply_markup,
-                parse_mode="Markdown"
+            await self.safe_edit(
+                update.callback_query,
+                _EMPTY_PENDING_TEXT,
+                reply_markup=_BACK_TO_ADMIN_KB
             )
             return
         
-        # Build keyboard with pending users
-        keyboard = []
-        for user in pending:
-            username = user.username or f"user_{user.id}"
-            label = f"@{username}"
-            keyboard.append([
-                InlineKeyboardButton(label, callback_data=f"admin_approve_{user.id}")
-            ])
+        # Cache what user_approval_menu needs, so it can skip get_by_id
+        context.user_data['pending_cache'] = (
+            {user.id: (user.username, user.status) for user in pending},
+            time.monotonic() + _PENDING_CACHE_TTL,
+        )
         
-        keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="admin_panel")])
+        # Build keyboard with pending users
+        keyboard = [
+            [InlineKeyboardButton(
+                f"@{user.username or f'user_{user.id}'}",
+                callback_data=f"admin_approve_{user.id}"
+            )]
+            for user in pending
+        ]
+        keyboard.append(_BACK_ADMIN)
         reply_markup = InlineKeyboardMarkup(keyboard)
         
-        await update.callback_query.edit_message_text(
-            "👥 *Pending Users*\n\n"
+        await self.safe_edit(
+            update.callback_query,
+            "👥 <b>Pending Users</b>\n\n"
             f"Found {len(pending)} pending approvals\n\n"
             "Select user to approve/reject:",
-            reply_markup=reply_markup,
-            parse_mode="Markdown"
+            reply_markup=reply_markup
         )
     
     async def user_approval_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
                                 user_repo=None):
         """Show user approval options."""
-        user_id = update.effective_user.id
-        
-        # Check admin
-        if not await self.is_admin(user_id):
+        admin_id = self._admin_gate(update)
+        if admin_id is None:
             await update.callback_query.answer("❌ Admin only")
             return
         
         # Extract user ID to approve
-        target_user_id = int(update.callback_query.data.split("_")[2])
-        
-        # Get user info
-        user = None
-        if user_repo:
-            user = await user_repo.get_by_id(target_user_id)
-        
-        if not user:
-            await update.callback_query.answer("❌ User not found", show_alert=True)
+        match = _ADMIN_CB.match(update.callback_query.data)
+        if not match:
+            await update.callback_query.answer("❌ Invalid request")
             return
+        target_user_id = int(match.group(3))
         
-        # Store target user ID
-        context.user_data['approval_target'] = target_user_id
+        # Get user info (from the pending list cache when still fresh)
+        cache, expires_at = context.user_data.get('pending_cache', ({}, 0))
+        cached = cache.get(target_user_id) if time.monotonic() < expires_at else None
+        
+        if cached:
+            username, status = cached
+        else:
+            user = None
+            user_repo = user_repo or self.user_repo
+            if user_repo:
+                user = await user_repo.get_by_id(target_user_id)
+            
+            if not user:
+                await update.callback_query.answer("❌ User not found", show_alert=True)
+                return
+            
+            username, status = user.username, user.status
         
         keyboard = [
             [InlineKeyboardButton("✅ Approve (Free)", callback_data=f"admin_approve_free_{target_user_id}")],
@@ -119,46 +150,50 @@ class AdminHandlers(BaseHandler):
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
-        username = user.username or f"user_{target_user_id}"
+        username = username or f"user_{target_user_id}"
         
-        await update.callback_query.edit_message_text(
-            f"👤 *Approve @{username}*\n\n"
-            f"ID: `{target_user_id}`\n"
-            f"Status: `{user.status}`\n\n"
+        await self.safe_edit(
+            update.callback_query,
+            f"👤 <b>Approve @{html.escape(username)}</b>\n\n"
+            f"ID: <code>{target_user_id}</code>\n"
+            f"Status: <code>{status}</code>\n\n"
             "Select plan to approve or reject:",
-            reply_markup=reply_markup,
-            parse_mode="Markdown"
+            reply_markup=reply_markup
         )
     
     async def approve_user(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
-                          user_repo=None, audit_logger=None):
+                          user_repo=None):
         """Approve user with selected plan."""
-        admin_id = update.effective_user.id
-        
-        # Check admin
-        if not await self.is_admin(admin_id):
+        admin_id = self._admin_gate(update)
+        if admin_id is None:
             await update.callback_query.answer("❌ Admin only")
             return
         
         # Extract plan and user ID
-        parts = update.callback_query.data.split("_")
-        plan = parts[2]  # free, pro, ultra
-        target_user_id = int(parts[3])
+        match = _ADMIN_CB.match(update.callback_query.data)
+        if not match or not match.group(2):
+            await update.callback_query.answer("❌ Invalid request")
+            return
+        _, plan, target_user_id = match.groups()  # plan: free, pro, ultra
+        target_user_id = int(target_user_id)
         
         # Update user status and plan
+        user_repo = user_repo or self.user_repo
         if user_repo:
             try:
-                await user_repo.update_status(target_user_id, "approved")
-                # TODO: Update plan in database
+                await user_repo.update_status(target_user_id, "approved", plan=plan)
+                self.invalidate(target_user_id)
+                context.user_data.pop('pending_cache', None)
                 
                 await update.callback_query.answer(f"✅ User approved with {plan} plan")
                 
-                await update.callback_query.edit_message_text(
+                await self.safe_edit(
+                    update.callback_query,
                     f"✅ User approved!\n"
-                    f"Plan: `{plan}`"
+                    f"Plan: <code>{plan}</code>"
                 )
                 
-                await self.log_action(
+                self.log_action(
                     admin_id, "user.approved", "user",
                     resource_id=str(target_user_id), status="success",
                     details={"plan": plan}
@@ -171,29 +206,37 @@ class AdminHandlers(BaseHandler):
                 await update.callback_query.answer("❌ Error approving user", show_alert=True)
     
     async def reject_user(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
-                         user_repo=None, audit_logger=None):
+                         user_repo=None):
         """Reject user approval."""
-        admin_id = update.effective_user.id
-        
-        # Check admin
-        if not await self.is_admin(admin_id):
+        admin_id = self._admin_gate(update)
+        if admin_id is None:
             await update.callback_query.answer("❌ Admin only")
             return
         
         # Extract user ID
-        target_user_id = int(update.callback_query.data.split("_")[2])
+        match = _ADMIN_CB.match(update.callback_query.data)
+        if not match:
+            await update.callback_query.answer("❌ Invalid request")
+            return
+        target_user_id = int(match.group(3))
         
-        # Mark user as blocked
+        # Mark user as rejected (kept apart from 'blocked' bans)
+        user_repo = user_repo or self.user_repo
         if user_repo:
             try:
-                # TODO: Implement rejection logic
+                await user_repo.update_status(
+                    target_user_id, "rejected", reason="Application rejected"
+                )
+                self.invalidate(target_user_id)
+                context.user_data.pop('pending_cache', None)
                 await update.callback_query.answer("✅ User rejected")
                 
-                await update.callback_query.edit_message_text(
+                await self.safe_edit(
+                    update.callback_query,
                     f"❌ User rejected"
                 )
                 
-                await self.log_action(
+                self.log_action(
                     admin_id, "user.rejected", "user",
                     resource_id=str(target_user_id), status="success"
                 )
@@ -205,51 +248,34 @@ class AdminHandlers(BaseHandler):
     async def system_stats(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
                           user_repo=None, bot_repo=None):
         """Show system statistics."""
-        user_id = update.effective_user.id
-        
-        # Check admin
-        if not await self.is_admin(user_id):
+        admin_id = self._admin_gate(update)
+        if admin_id is None:
             await update.callback_query.answer("❌ Admin only")
             return
         
         # Gather stats
-        total_users = 0
-        approved_users = 0
-        total_bots = 0
-        running_bots = 0
+        stats = {
+            "total_users": 0,
+            "approved_users": 0,
+            "total_bots": 0,
+            "running_bots": 0,
+        }
         
         # TODO: Implement stats gathering from database
         
-        stats_text = (
-            "📊 *System Statistics*\n\n"
-            f"👥 *Users*\n"
-            f"• Total: `{total_users}`\n"
-            f"• Approved: `{approved_users}`\n\n"
-            f"🤖 *Bots*\n"
-            f"• Total: `{total_bots}`\n"
-            f"• Running: `{running_bots}`\n\n"
-            f"💾 *Database*\n"
-            f"• Status: `Connected`"
-        )
-        
-        keyboard = [
-            [InlineKeyboardButton("🔙 Back", callback_data="admin_panel")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        stats_text = _STATS_TMPL.format_map(stats)
         
-        await update.callback_query.edit_message_text(
+        await self.safe_edit(
+            update.callback_query,
             stats_text,
-            reply_markup=reply_markup,
-            parse_mode="Markdown"
+            reply_markup=_BACK_TO_ADMIN_KB
         )
     
     async def error_logs(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
                         error_log_repo=None):
         """Show recent error logs."""
-        user_id = update.effective_user.id
-        
-        # Check admin
-        if not await self.is_admin(user_id):
+        admin_id = self._admin_gate(update)
+        if admin_id is None:
             await update.callback_query.answer("❌ Admin only")
             return
         
@@ -258,44 +284,50 @@ class AdminHandlers(BaseHandler):
         # TODO: Fetch from error_log_repo
         
         if not errors:
-            logs_text = "🚨 *Error Logs*\n\nNo recent errors."
+            logs_text = "🚨 <b>Error Logs</b>\n\nNo recent errors."
         else:
-            logs_text = "🚨 *Recent Errors*\n\n"
+            logs_text = "🚨 <b>Recent Errors</b>\n\n"
             for error in errors[:10]:
-                logs_text += f"• {error.level}: {error.message}\n"
+                logs_text += f"• {error.level}: {html.escape(error.message)}\n"
         
-        keyboard = [
-            [InlineKeyboardButton("🔙 Back", callback_data="admin_panel")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        await update.callback_query.edit_message_text(
+        await self.safe_edit(
+            update.callback_query,
             logs_text,
-            reply_markup=reply_markup,
-            parse_mode="Markdown"
+            reply_markup=_BACK_TO_ADMIN_KB
         )
     
     async def broadcast_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
                                user_repo=None):
         """Send broadcast message to all users."""
-        user_id = update.effective_user.id
-        
-        # Check admin
-        if not await self.is_admin(user_id):
+        admin_id = self._admin_gate(update)
+        if admin_id is None:
             await update.message.reply_text("❌ Admin only")
             return
         
-        # Get message text
-        message_text = update.message.text.replace("/broadcast ", "")
+        # Get message text: everything after the command, line breaks kept
+        if not context.args:
+            await update.message.reply_text(_BROADCAST_USAGE_TEXT, parse_mode=None)
+            return
+        message_text = update.message.text.split(None, 1)[1]
+        
+        # Send to all approved users (paced, flood-control aware)
+        recipients = []
+        user_repo = user_repo or self.user_repo
+        if user_repo:
+            recipients = await user_repo.get_approved_user_ids()
         
-        # TODO: Send to all approved users
+        notifier = NotificationService(context.application)
+        results = await notifier.broadcast(recipients, message_text, parse_mode=None)
+        sent = results["sent"]
         
         await update.message.reply_text(
-            f"✅ Broadcast sent to users:\n"
-            f"Message: {message_text[:50]}..."
+            f"✅ Broadcast sent to {sent}/{len(recipients)} users:\n"
+            f"Message: {message_text[:50]}...",
+            parse_mode=None
         )
         
-        await self.log_action(
-            user_id, "admin.broadcast", "system",
-            status="success", details={"message": message_text[:100]}
+        self.log_action(
+            admin_id, "admin.broadcast", "system",
+            status="success",
+            details={"message": message_text[:100], "sent": sent, "total": len(recipients)}
         )
@@ -1,14 +1,25 @@
 """Base handler with security checks and permissions."""
 
 import logging
-from typing import Optional, Callable, Any
-from telegram import Update
+import time
+from collections import OrderedDict
+from typing import Optional, Callable, Any, Tuple
+from telegram import Update, CallbackQuery, InlineKeyboardMarkup
+from telegram.error import BadRequest
 from telegram.ext import ContextTypes
 from functools import wraps
 
 logger = logging.getLogger(__name__)
 
 
+def _lru_put(cache: OrderedDict, key: Any, value: Any, max_size: int) -> None:
+    """Insert into an OrderedDict LRU, evicting the oldest entry when full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+
+
 class BaseHandler:
     """
     Base handler for all Telegram commands.
@@ -21,7 +32,25 @@ class BaseHandler:
     - Error handling
     """
     
-    def __init__(self, admin_id: int, rate_limiter=None, audit_logger=None, permission_checker=None):
+    AUTH_CACHE_TTL = 60  # seconds
+    AUTH_CACHE_MAX = 4096  # user_id entries
+    CALLBACK_DEBOUNCE = 0.5  # seconds between identical button presses
+    CALLBACK_DEBOUNCE_MAX = 4096  # (user_id, callback_data) entries
+    MSG_HASH_MAX = 4096  # (chat_id, message_id) entries
+    
+    # user_id -> (status, expires_at), LRU-bounded. Class-level so every
+    # handler instance sees invalidate() calls from AdminHandlers and from
+    # services wired with BaseHandler.invalidate.
+    _auth_cache: "OrderedDict[int, Tuple[Optional[str], float]]" = OrderedDict()
+    
+    # (user_id, callback_data) -> monotonic time of last handled press
+    _last_cb: "OrderedDict[Tuple[int, str], float]" = OrderedDict()
+    
+    # (chat_id, message_id) -> hash of the text + keyboard last sent by safe_edit
+    _msg_hash: "OrderedDict[Tuple[int, int], int]" = OrderedDict()
+    
+    def __init__(self, admin_id: int, rate_limiter=None, audit_logger=None, permission_checker=None,
+                 user_repo=None, bot_repo=None):
         """
         Initialize base handler.
         
@@ -30,11 +59,15 @@ class BaseHandler:
             rate_limiter: RateLimiter instance
             audit_logger: AuditLogger instance
             permission_checker: PermissionChecker instance
+            user_repo: UserRepository used by auth checks
+            bot_repo: BotRepository used by permission checks
         """
         self.admin_id = admin_id
         self.rate_limiter = rate_limiter
         self.audit_logger = audit_logger
         self.permission_checker = permission_checker
+        self.user_repo = user_repo
+        self.bot_repo = bot_repo
     
     async def check_auth(self, user_id: int, user_repo=None) -> bool:
         """
@@ -42,7 +75,7 @@ class BaseHandler:
         
         Args:
             user_id: Telegram user ID
-            user_repo: UserRepository instance
+            user_repo: UserRepository instance (defaults to self.user_repo)
         
         Returns:
             True if user is approved or is admin
@@ -51,14 +84,33 @@ class BaseHandler:
         if user_id == self.admin_id:
             return True
         
+        now = time.monotonic()
+        cached = self._auth_cache.get(user_id)
+        if cached and now < cached[1]:
+            self._auth_cache.move_to_end(user_id)
+            return cached[0] == "approved"
+        
         # Check if user exists and is approved
+        user_repo = user_repo or self.user_repo
         if user_repo:
             user = await user_repo.get_by_id(user_id)
-            if user and user.status == "approved":
-                return True
+            status = user.status if user else None
+            _lru_put(self._auth_cache, user_id, (status, now + self.AUTH_CACHE_TTL),
+                     self.AUTH_CACHE_MAX)
+            return status == "approved"
         
         return False
     
+    @classmethod
+    def invalidate(cls, user_id: int) -> None:
+        """
+        Drop cached auth status after the user's status changes.
+        
+        A classmethod so services can be handed BaseHandler.invalidate
+        without a handler instance.
+        """
+        cls._auth_cache.pop(user_id, None)
+    
     async def check_rate_limit(self, user_id: int, action: str, limit: int = 10, window: int = 60) -> tuple:
         """
         Check rate limit for action.
@@ -80,12 +132,16 @@ class BaseHandler:
         
         return allowed, retry_after
     
-    async def log_action(self, user_id: int, action: str, resource_type: str = "user",
-                        resource_id: Optional[str] = None, status: str = "success",
-                        error_code: Optional[str] = None, details: Optional[dict] = None):
+    def log_action(self, user_id: int, action: str, resource_type: str = "user",
+                   resource_id: Optional[str] = None, status: str = "success",
+                   error_code: Optional[str] = None, details: Optional[dict] = None) -> None:
         """
         Log action to audit trail.
         
+        The record is handed to AuditLogger's queue and written by its
+        background flusher in batched INSERTs; nothing is awaited here, and
+        it is a no-op when no audit logger is configured.
+        
         Args:
             user_id: User ID
             action: Action name (e.g., 'bot.start')
@@ -95,18 +151,16 @@ class BaseHandler:
             error_code: Error code if status is failure
             details: Additional details
         """
-        if not self.audit_logger:
-            return
-        
-        await self.audit_logger.log_action(
-            user_id=user_id,
-            action=action,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            status=status,
-            error_code=error_code,
-            details=details or {}
-        )
+        if self.audit_logger:
+            self.audit_logger.enqueue(
+                user_id=user_id,
+                action=action,
+                status=status,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                error_code=error_code,
+                details=details,
+            )
     
     async def check_permission(self, user_id: int, resource_id: int, bot_repo=None) -> bool:
         """
@@ -115,7 +169,7 @@ class BaseHandler:
         Args:
             user_id: User ID
             resource_id: Bot ID or resource ID
-            bot_repo: BotRepository instance
+            bot_repo: BotRepository instance (defaults to self.bot_repo)
         
         Returns:
             True if user owns resource
@@ -123,6 +177,7 @@ class BaseHandler:
         if user_id == self.admin_id:
             return True
         
+        bot_repo = bot_repo or self.bot_repo
         if bot_repo:
             bot = await bot_repo.get_by_id(resource_id)
             if bot and bot.user_id == user_id:
@@ -130,18 +185,106 @@ class BaseHandler:
         
         return False
     
+    async def get_bot_checked(self, user_id: int, bot_id: int, bot_repo=None) -> Tuple[Any, bool]:
+        """
+        Fetch bot and check ownership with a single repository call.
+        
+        Args:
+            user_id: User ID
+            bot_id: Bot ID
+            bot_repo: BotRepository instance (defaults to self.bot_repo)
+        
+        Returns:
+            (bot or None, allowed) - admin is always allowed
+        """
+        is_admin = user_id == self.admin_id
+        bot_repo = bot_repo or self.bot_repo
+        if not bot_repo:
+            return None, is_admin
+        
+        bot, allowed = await bot_repo.get_with_permission(user_id, bot_id)
+        return bot, allowed or is_admin
+    
     async def is_admin(self, user_id: int) -> bool:
         """Check if user is admin."""
         return user_id == self.admin_id
     
+    def _is_admin_sync(self, user_id: int) -> bool:
+        """Check if user is admin without creating a coroutine."""
+        return user_id == self.admin_id
+    
+    def _admin_gate(self, update: Update) -> Optional[int]:
+        """Return the sender's ID if they are admin, else None."""
+        user_id = update.effective_user.id
+        return user_id if user_id == self.admin_id else None
+    
+    async def _debounce_callback(self, update: Update) -> bool:
+        """
+        Drop rapid repeats of the same button press.
+        
+        Returns:
+            True if the callback was answered as a duplicate and the
+            handler should return without doing any work
+        """
+        query = update.callback_query
+        key = (update.effective_user.id, query.data)
+        now = time.monotonic()
+        
+        last = self._last_cb.get(key)
+        if last is not None and now - last < self.CALLBACK_DEBOUNCE:
+            await query.answer()
+            return True
+        
+        _lru_put(self._last_cb, key, now, self.CALLBACK_DEBOUNCE_MAX)
+        return False
+    
+    async def safe_edit(self, query: CallbackQuery, text: str,
+                        reply_markup: Optional[InlineKeyboardMarkup] = None, **kwargs) -> None:
+        """
+        Edit the callback's message unless it already shows this content.
+        
+        Skips the API round trip when text and keyboard match what was last
+        sent for the message, and treats Telegram's "message is not
+        modified" error as a no-op.
+        
+        Args:
+            query: Callback query whose message is edited
+            text: New message text
+            reply_markup: New inline keyboard
+            **kwargs: Passed through to edit_message_text
+        """
+        message = query.message
+        key = (message.chat_id, message.message_id) if message else None
+        keyboard = reply_markup.inline_keyboard if reply_markup else ()
+        digest = hash((
+            text,
+            tuple((b.text, b.callback_data) for row in keyboard for b in row),
+        ))
+        
+        if key is not None and self._msg_hash.get(key) == digest:
+            return
+        
+        try:
+            await query.edit_message_text(text, reply_markup=reply_markup, **kwargs)
+        except BadRequest as e:
+            if "message is not modified" not in str(e).lower():
+                raise
+        
+        if key is not None:
+            _lru_put(self._msg_hash, key, digest, self.MSG_HASH_MAX)
+    
+    @staticmethod
+    def _id_from_cb(data: str) -> int:
+        """Parse the trailing numeric ID from callback data like 'bot_manage_42'."""
+        return int(data.rpartition("_")[2])
+    
     def require_auth(self, func: Callable) -> Callable:
         """Decorator: require authentication."""
         @wraps(func)
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
             user_id = update.effective_user.id
-            user_repo = kwargs.get('user_repo')
             
-            if not await self.check_auth(user_id, user_repo):
+            if not await self.check_auth(user_id):
                 await update.message.reply_text(
                     "❌ You don't have access. Please request approval from admin."
                 )
@@ -157,7 +300,7 @@ class BaseHandler:
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
             user_id = update.effective_user.id
             
-            if not await self.is_admin(user_id):
+            if not self._is_admin_sync(user_id):
                 await update.message.reply_text(
                     "❌ Admin only."
                 )
@@ -195,9 +338,8 @@ class BaseHandler:
             
             # Get resource ID from context data
             resource_id = context.user_data.get('resource_id')
-            bot_repo = kwargs.get('bot_repo')
             
-            if resource_id and not await self.check_permission(user_id, resource_id, bot_repo):
+            if resource_id and not await self.check_permission(user_id, resource_id):
                 await update.message.reply_text(
                     "❌ You don't have permission to access this resource."
                 )
@@ -208,61 +350,99 @@ class BaseHandler:
         return wrapper
 
 
+async def _check_admin(self, update: Update, user_id: int) -> bool:
+    """security_handler check: admin only."""
+    if self._is_admin_sync(user_id):
+        return True
+    await update.message.reply_text("❌ Admin only.")
+    return False
+
+
+async def _check_auth(self, update: Update, user_id: int) -> bool:
+    """security_handler check: approved users."""
+    if await self.check_auth(user_id):
+        return True
+    await update.message.reply_text(
+        "❌ You don't have access. Please request approval."
+    )
+    return False
+
+
+def _rate_limit_check(action: str, limit: int, window: int) -> Callable:
+    """Build a security_handler check bound to one rate limit."""
+    async def check(self, update: Update, user_id: int) -> bool:
+        allowed, retry_after = await self.check_rate_limit(user_id, action, limit, window)
+        if allowed:
+            return True
+        await update.message.reply_text(
+            f"⏱️ Rate limited. Retry in {retry_after}s."
+        )
+        return False
+    
+    return check
+
+
 def security_handler(auth=True, admin=False, rate_limit=None, log_action=None):
     """
     Decorator combining all security checks.
     
+    The wrapper is specialized at decoration time: only the enabled checks
+    are collected, so no per-call branching on the options remains.
+    
     Args:
         auth: Require authentication
         admin: Require admin access
         rate_limit: (action, limit, window) tuple for rate limiting
         log_action: (action, resource_type) tuple for logging
     """
+    checks = []
+    if admin:
+        checks.append(_check_admin)
+    elif auth:
+        checks.append(_check_auth)
+    if rate_limit:
+        checks.append(_rate_limit_check(*rate_limit))
+    checks = tuple(checks)
+    
     def decorator(func: Callable) -> Callable:
+        if not checks and not log_action:
+            return func
+        
+        if not log_action:
+            @wraps(func)
+            async def wrapper(self, update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+                user_id = update.effective_user.id
+                for check in checks:
+                    if not await check(self, update, user_id):
+                        return
+                
+                return await func(self, update, context, *args, **kwargs)
+            
+            return wrapper
+        
+        action_name, resource_type = log_action
+        
         @wraps(func)
-        async def wrapper(self, update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+        async def logged_wrapper(self, update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
             user_id = update.effective_user.id
-            
-            # Check admin if required
-            if admin:
-                if not await self.is_admin(user_id):
-                    await update.message.reply_text("❌ Admin only.")
-                    return
-            
-            # Check auth if required (and not admin)
-            elif auth:
-                user_repo = kwargs.get('user_repo')
-                if not await self.check_auth(user_id, user_repo):
-                    await update.message.reply_text(
-                        "❌ You don't have access. Please request approval."
-                    )
+            for check in checks:
+                if not await check(self, update, user_id):
                     return
             
-            # Check rate limit
-            if rate_limit:
-                action, limit, window = rate_limit
-                allowed, retry_after = await self.check_rate_limit(user_id, action, limit, window)
-                if not allowed:
-                    await update.message.reply_text(
-                        f"⏱️ Rate limited. Retry in {retry_after}s."
-                    )
-                    return
+            # Audit records are queued, never awaited, so the audit write
+            # stays off the response path on both branches
+            try:
+                result = await func(self, update, context, *args, **kwargs)
+            except Exception:
+                self.log_action(
+                    user_id, action_name, resource_type,
+                    status="failure", error_code="HANDLER_ERROR"
+                )
+                raise
             
-            # Log action
-            if log_action:
-                action_name, resource_type = log_action
-                try:
-                    await func(update, context, *args, **kwargs)
-                    await self.log_action(user_id, action_name, resource_type, status="success")
-                except Exception as e:
-                    await self.log_action(
-                        user_id, action_name, resource_type,
-                        status="failure", error_code="HANDLER_ERROR"
-                    )
-                    raise
-            else:
-                return await func(update, context, *args, **kwargs)
+            self.log_action(user_id, action_name, resource_type)
+            return result
         
-        return wrapper
+        return logged_wrapper
     
     return decorator
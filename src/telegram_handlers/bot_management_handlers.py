@@ -1,5 +1,6 @@
 """Bot management handlers - start, stop, delete, manage."""
 
+import html
 import logging
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
@@ -9,6 +10,53 @@ from src.utils import seconds_to_human, render_bar
 
 logger = logging.getLogger(__name__)
 
+# Static message texts
+_NO_BOTS_TEXT = "📂 <b>My Bots</b>\n\nYou don't have any bots yet.\nUpload your first bot!"
+_DELETE_CONFIRM_TEXT = "🗑️ <b>Delete Bot</b>\n\n⚠️ Are you sure? This cannot be undone!"
+
+# manage_bot / bot_details bodies, filled with str.format
+_MANAGE_TMPL = (
+    "🤖 <b>{name}</b>\n\n"
+    "Status: <code>{status}</code>\n\n"
+    "⏱️ Time\n"
+    "{time_bar}\n"
+    "Remaining: <code>{remaining}</code>\n\n"
+    "⚡ Power\n"
+    "{power_bar}\n"
+    "Remaining: <code>{power:.1f}%</code>"
+)
+_DETAILS_TMPL = (
+    "🤖 <b>Bot Details: {name}</b>\n\n"
+    "🔧 <b>Configuration</b>\n"
+    "• ID: <code>{id}</code>\n"
+    "• Created: <code>{created:%Y-%m-%d %H:%M}</code>\n"
+    "• Status: <code>{status}</code>\n\n"
+    "⏱️ <b>Hosting Time</b>\n"
+    "• Total: <code>{total}</code>\n"
+    "• Remaining: <code>{remaining}</code>\n"
+    "• Running since: <code>{running_since}</code>\n\n"
+    "⚡ <b>Power</b>\n"
+    "• Max: <code>{power_max:.1f}%</code>\n"
+    "• Current: <code>{power:.1f}%</code>\n"
+    "• CPU Usage: <code>{cpu:.1f}%</code>\n"
+    "• Memory: <code>{memory:.1f} MB</code>"
+)
+
+# Bots per my_bots page; pages after the first use callback data my_bots_p<n>
+_MY_BOTS_PAGE_SIZE = 8
+_MY_BOTS_PAGE_PREFIX = "my_bots_p"
+
+# Bot list status icon; anything not running shows as stopped
+_STATUS_ICON = {"running": "🟢"}
+
+# Static keyboards (PTB telegram objects are immutable, safe to share)
+_BACK_MAIN = (InlineKeyboardButton("🔙 Back", callback_data="main_menu"),)
+_BACK_MY_BOTS = (InlineKeyboardButton("🔙 Back", callback_data="my_bots"),)
+_NO_BOTS_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("➕ Upload Bot", callback_data="bot_upload")],
+    _BACK_MAIN,
+])
+
 
 class BotManagementHandlers(BaseHandler):
     """Handle bot management commands."""
@@ -23,68 +71,92 @@ class BotManagementHandlers(BaseHandler):
             await update.callback_query.answer("❌ Not authenticated")
             return
         
-        # Get user's bots
+        # Page from my_bots_p<n>; plain my_bots (and delete_bot's re-render)
+        # and malformed page numbers are page 0
+        data = update.callback_query.data or ""
+        page = 0
+        if data.startswith(_MY_BOTS_PAGE_PREFIX):
+            try:
+                page = max(0, int(data[len(_MY_BOTS_PAGE_PREFIX):]))
+            except ValueError:
+                page = 0
+        
+        # Get one page of user's bots, plus one row to detect a next page
         bots = []
+        bot_repo = bot_repo or self.bot_repo
         if bot_repo:
-            bots = await bot_repo.get_user_bots(user_id)
-        
-        if not bots:
-            keyboard = [
-                [InlineKeyboardButton("➕ Upload Bot", callback_data="bot_upload")],
-                [InlineKeyboardButton("🔙 Back", callback_data="main_menu")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await update.callback_query.edit_message_text(
-                "📂 *My Bots*\n\n"
-                "You don't have any bots yet.\n"
-                "Upload your first bot!",
-                reply_markup=reply_markup,
-                parse_mode="Markdown"
+            bots = await self._bot_page(bot_repo, user_id, page)
+            if not bots and page > 0:
+                # Past the end (e.g. bots deleted since the list was shown):
+                # clamp to the last page
+                total = await bot_repo.count_user_bots(user_id)
+                page = max(0, (total - 1) // _MY_BOTS_PAGE_SIZE)
+                bots = await self._bot_page(bot_repo, user_id, page)
+        has_next = len(bots) > _MY_BOTS_PAGE_SIZE
+        bots = bots[:_MY_BOTS_PAGE_SIZE]
+        
+        if not bots and page == 0:
+            await self.safe_edit(
+                update.callback_query,
+                _NO_BOTS_TEXT,
+                reply_markup=_NO_BOTS_KB
             )
             return
         
         # Build bots list
-        keyboard = []
-        for bot in bots:
-            status_icon = "🟢" if bot.status == "running" else "🔴"
-            remaining = seconds_to_human(bot.remaining_seconds) if bot.remaining_seconds > 0 else "Expired"
-            
-            label = f"{status_icon} {bot.name} - {remaining}"
-            keyboard.append([
-                InlineKeyboardButton(label, callback_data=f"bot_manage_{bot.id}")
-            ])
+        keyboard = [
+            [InlineKeyboardButton(
+                f"{_STATUS_ICON.get(bot.status, '🔴')} {bot.name} - "
+                f"{seconds_to_human(bot.remaining_seconds) if bot.remaining_seconds > 0 else 'Expired'}",
+                callback_data=f"bot_manage_{bot.id}"
+            )]
+            for bot in bots
+        ]
+        
+        nav = []
+        if page > 0:
+            nav.append(InlineKeyboardButton("⬅️ Prev", callback_data=f"{_MY_BOTS_PAGE_PREFIX}{page - 1}"))
+        if has_next:
+            nav.append(InlineKeyboardButton("Next ➡️", callback_data=f"{_MY_BOTS_PAGE_PREFIX}{page + 1}"))
+        if nav:
+            keyboard.append(nav)
         
-        keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="main_menu")])
+        keyboard.append(_BACK_MAIN)
         reply_markup = InlineKeyboardMarkup(keyboard)
         
-        await update.callback_query.edit_message_text(
-            "📂 *My Bots*\n\n"
+        await self.safe_edit(
+            update.callback_query,
+            "📂 <b>My Bots</b>\n\n"
             "Select a bot to manage:",
-            reply_markup=reply_markup,
-            parse_mode="Markdown"
+            reply_markup=reply_markup
         )
         
-        await self.log_action(user_id, "bot.list_viewed", "bot", status="success")
+        self.log_action(user_id, "bot.list_viewed", "bot", status="success")
+    
+    @staticmethod
+    async def _bot_page(bot_repo, user_id: int, page: int):
+        """Fetch one my_bots page of summaries plus one extra row (has-next probe)."""
+        return await bot_repo.get_user_bot_summaries(
+            user_id, limit=_MY_BOTS_PAGE_SIZE + 1, offset=page * _MY_BOTS_PAGE_SIZE
+        )
     
     async def manage_bot(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
                         bot_repo=None):
         """Show bot management menu."""
+        if await self._debounce_callback(update):
+            return
+        
         user_id = update.effective_user.id
         
         # Extract bot ID from callback data
-        bot_id = int(update.callback_query.data.split("_")[2])
+        bot_id = self._id_from_cb(update.callback_query.data)
         
-        # Check permission
-        if not await self.check_permission(user_id, bot_id, bot_repo):
+        # Get bot info and check permission
+        bot, allowed = await self.get_bot_checked(user_id, bot_id, bot_repo)
+        if not allowed:
             await update.callback_query.answer("❌ Permission denied")
             return
         
-        # Get bot info
-        bot = None
-        if bot_repo:
-            bot = await bot_repo.get_by_id(bot_id)
-        
         if not bot:
             await update.callback_query.answer("❌ Bot not found", show_alert=True)
             return
@@ -102,7 +174,7 @@ class BotManagementHandlers(BaseHandler):
             [InlineKeyboardButton("⏱️ Add Time", callback_data=f"bot_addtime_{bot_id}")],
             [InlineKeyboardButton("⚡ Add Power", callback_data=f"bot_addpower_{bot_id}")],
             [InlineKeyboardButton("🗑️ Delete", callback_data=f"bot_confirm_del_{bot_id}")],
-            [InlineKeyboardButton("🔙 Back", callback_data="my_bots")]
+            _BACK_MY_BOTS,
         ])
         
         reply_markup = InlineKeyboardMarkup(keyboard)
@@ -115,60 +187,54 @@ class BotManagementHandlers(BaseHandler):
             (bot.power_remaining / bot.power_max * 100) if bot.power_max > 0 else 0
         )
         
-        text = (
-            f"🤖 *{bot.name}*\n\n"
-            f"Status: `{bot.status}`\n\n"
-            f"⏱️ Time\n"
-            f"{time_bar}\n"
-            f"Remaining: `{seconds_to_human(bot.remaining_seconds)}`\n\n"
-            f"⚡ Power\n"
-            f"{power_bar}\n"
-            f"Remaining: `{bot.power_remaining:.1f}%`"
+        text = _MANAGE_TMPL.format(
+            name=html.escape(bot.name),
+            status=bot.status,
+            time_bar=time_bar,
+            remaining=seconds_to_human(bot.remaining_seconds),
+            power_bar=power_bar,
+            power=bot.power_remaining,
         )
         
-        await update.callback_query.edit_message_text(
+        await self.safe_edit(
+            update.callback_query,
             text,
-            reply_markup=reply_markup,
-            parse_mode="Markdown"
+            reply_markup=reply_markup
         )
     
     async def bot_details(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
                          bot_repo=None):
         """Show detailed bot information."""
+        if await self._debounce_callback(update):
+            return
+        
         user_id = update.effective_user.id
         
         # Extract bot ID
-        bot_id = int(update.callback_query.data.split("_")[2])
+        bot_id = self._id_from_cb(update.callback_query.data)
         
-        # Check permission
-        if not await self.check_permission(user_id, bot_id, bot_repo):
+        # Get bot info and check permission
+        bot, allowed = await self.get_bot_checked(user_id, bot_id, bot_repo)
+        if not allowed:
             await update.callback_query.answer("❌ Permission denied")
             return
         
-        # Get bot info
-        bot = None
-        if bot_repo:
-            bot = await bot_repo.get_by_id(bot_id)
-        
         if not bot:
             await update.callback_query.answer("❌ Bot not found", show_alert=True)
             return
         
-        details_text = (
-            f"🤖 *Bot Details: {bot.name}*\n\n"
-            f"🔧 *Configuration*\n"
-            f"• ID: `{bot.id}`\n"
-            f"• Created: `{bot.created_at.strftime('%Y-%m-%d %H:%M')}`\n"
-            f"• Status: `{bot.status}`\n\n"
-            f"⏱️ *Hosting Time*\n"
-            f"• Total: `{seconds_to_human(bot.total_seconds)}`\n"
-            f"• Remaining: `{seconds_to_human(bot.remaining_seconds)}`\n"
-            f"• Running since: `{bot.start_time.strftime('%Y-%m-%d %H:%M') if bot.start_time else 'N/A'}`\n\n"
-            f"⚡ *Power*\n"
-            f"• Max: `{bot.power_max:.1f}%`\n"
-            f"• Current: `{bot.power_remaining:.1f}%`\n"
-            f"• CPU Usage: `{bot.cpu_usage_percent:.1f}%`\n"
-            f"• Memory: `{bot.memory_usage_mb:.1f} MB`"
+        details_text = _DETAILS_TMPL.format(
+            name=html.escape(bot.name),
+            id=bot.id,
+            created=bot.created_at,
+            status=bot.status,
+            total=seconds_to_human(bot.total_seconds),
+            remaining=seconds_to_human(bot.remaining_seconds),
+            running_since=bot.start_time.strftime('%Y-%m-%d %H:%M') if bot.start_time else 'N/A',
+            power_max=bot.power_max,
+            power=bot.power_remaining,
+            cpu=bot.cpu_usage_percent,
+            memory=bot.memory_usage_mb,
         )
         
         keyboard = [
@@ -176,33 +242,32 @@ class BotManagementHandlers(BaseHandler):
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
-        await update.callback_query.edit_message_text(
+        await self.safe_edit(
+            update.callback_query,
             details_text,
-            reply_markup=reply_markup,
-            parse_mode="Markdown"
+            reply_markup=reply_markup
         )
         
-        await self.log_action(user_id, "bot.details_viewed", "bot", 
-                            resource_id=str(bot_id), status="success")
+        self.log_action(user_id, "bot.details_viewed", "bot", 
+                      resource_id=str(bot_id), status="success")
     
     async def start_bot(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
-                       bot_repo=None, audit_logger=None):
+                       bot_repo=None):
         """Start a bot."""
+        if await self._debounce_callback(update):
+            return
+        
         user_id = update.effective_user.id
         
         # Extract bot ID
-        bot_id = int(update.callback_query.data.split("_")[2])
+        bot_id = self._id_from_cb(update.callback_query.data)
         
-        # Check permission
-        if not await self.check_permission(user_id, bot_id, bot_repo):
+        # Get bot info and check permission
+        bot, allowed = await self.get_bot_checked(user_id, bot_id, bot_repo)
+        if not allowed:
             await update.callback_query.answer("❌ Permission denied")
             return
         
-        # Get bot info
-        bot = None
-        if bot_repo:
-            bot = await bot_repo.get_by_id(bot_id)
-        
         if not bot:
             await update.callback_query.answer("❌ Bot not found", show_alert=True)
             return
@@ -213,9 +278,9 @@ class BotManagementHandlers(BaseHandler):
                 "❌ No hosting time remaining",
                 show_alert=True
             )
-            await self.log_action(user_id, "bot.start_denied", "bot",
-                                resource_id=str(bot_id), status="failure",
-                                error_code="NO_TIME")
+            self.log_action(user_id, "bot.start_denied", "bot",
+                          resource_id=str(bot_id), status="failure",
+                          error_code="NO_TIME")
             return
         
         if bot.power_remaining <= 0:
@@ -223,9 +288,9 @@ class BotManagementHandlers(BaseHandler):
                 "❌ No power remaining",
                 show_alert=True
             )
-            await self.log_action(user_id, "bot.start_denied", "bot",
-                                resource_id=str(bot_id), status="failure",
-                                error_code="NO_POWER")
+            self.log_action(user_id, "bot.start_denied", "bot",
+                          resource_id=str(bot_id), status="failure",
+                          error_code="NO_POWER")
             return
         
         # TODO: Start bot in container (will be implemented in services)
@@ -233,41 +298,43 @@ class BotManagementHandlers(BaseHandler):
             await update.callback_query.answer("⏳ Starting bot...")
             
             # For now, just update status to running
+            bot_repo = bot_repo or self.bot_repo
             if bot_repo:
                 await bot_repo.update_status(bot_id, "running")
             
-            await update.callback_query.edit_message_text(
-                f"✅ Bot '{bot.name}' started successfully!"
+            await self.safe_edit(
+                update.callback_query,
+                f"✅ Bot '{bot.name}' started successfully!",
+                parse_mode=None
             )
             
-            await self.log_action(user_id, "bot.start_success", "bot",
-                                resource_id=str(bot_id), status="success")
+            self.log_action(user_id, "bot.start_success", "bot",
+                          resource_id=str(bot_id), status="success")
         
         except Exception as e:
             logger.error(f"Error starting bot {bot_id}: {e}")
             await update.callback_query.answer("❌ Error starting bot", show_alert=True)
-            await self.log_action(user_id, "bot.start_error", "bot",
-                                resource_id=str(bot_id), status="failure",
-                                error_code="LAUNCH_ERROR")
+            self.log_action(user_id, "bot.start_error", "bot",
+                          resource_id=str(bot_id), status="failure",
+                          error_code="LAUNCH_ERROR")
     
     async def stop_bot(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
-                      bot_repo=None, audit_logger=None):
+                      bot_repo=None):
         """Stop a running bot."""
+        if await self._debounce_callback(update):
+            return
+        
         user_id = update.effective_user.id
         
         # Extract bot ID
-        bot_id = int(update.callback_query.data.split("_")[2])
+        bot_id = self._id_from_cb(update.callback_query.data)
         
-        # Check permission
-        if not await self.check_permission(user_id, bot_id, bot_repo):
+        # Get bot info and check permission
+        bot, allowed = await self.get_bot_checked(user_id, bot_id, bot_repo)
+        if not allowed:
             await update.callback_query.answer("❌ Permission denied")
             return
         
-        # Get bot info
-        bot = None
-        if bot_repo:
-            bot = await bot_repo.get_by_id(bot_id)
-        
         if not bot:
             await update.callback_query.answer("❌ Bot not found", show_alert=True)
             return
@@ -277,27 +344,33 @@ class BotManagementHandlers(BaseHandler):
             await update.callback_query.answer("⏳ Stopping bot...")
             
             # For now, just update status
+            bot_repo = bot_repo or self.bot_repo
             if bot_repo:
                 await bot_repo.update_status(bot_id, "stopped")
             
-            await update.callback_query.edit_message_text(
-                f"✅ Bot '{bot.name}' stopped successfully!"
+            await self.safe_edit(
+                update.callback_query,
+                f"✅ Bot '{bot.name}' stopped successfully!",
+                parse_mode=None
             )
             
-            await self.log_action(user_id, "bot.stop_success", "bot",
-                                resource_id=str(bot_id), status="success")
+            self.log_action(user_id, "bot.stop_success", "bot",
+                          resource_id=str(bot_id), status="success")
         
         except Exception as e:
             logger.error(f"Error stopping bot {bot_id}: {e}")
             await update.callback_query.answer("❌ Error stopping bot", show_alert=True)
-            await self.log_action(user_id, "bot.stop_error", "bot",
-                                resource_id=str(bot_id), status="failure",
-                                error_code="STOP_ERROR")
+            self.log_action(user_id, "bot.stop_error", "bot",
+                          resource_id=str(bot_id), status="failure",
+                          error_code="STOP_ERROR")
     
     async def delete_bot_confirm(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Ask confirmation for deleting bot."""
+        if await self._debounce_callback(update):
+            return
+        
         # Extract bot ID
-        bot_id = int(update.callback_query.data.split("_")[3])
+        bot_id = self._id_from_cb(update.callback_query.data)
         
         keyboard = [
             [
@@ -307,20 +380,22 @@ class BotManagementHandlers(BaseHandler):
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
         
-        await update.callback_query.edit_message_text(
-            "🗑️ *Delete Bot*\n\n"
-            "⚠️ Are you sure? This cannot be undone!",
-            reply_markup=reply_markup,
-            parse_mode="Markdown"
+        await self.safe_edit(
+            update.callback_query,
+            _DELETE_CONFIRM_TEXT,
+            reply_markup=reply_markup
         )
     
     async def delete_bot(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
-                        bot_repo=None, audit_logger=None):
+                        bot_repo=None):
         """Delete a bot."""
+        if await self._debounce_callback(update):
+            return
+        
         user_id = update.effective_user.id
         
         # Extract bot ID
-        bot_id = int(update.callback_query.data.split("_")[2])
+        bot_id = self._id_from_cb(update.callback_query.data)
         
         # Check permission
         if not await self.check_permission(user_id, bot_id, bot_repo):
@@ -329,22 +404,24 @@ class BotManagementHandlers(BaseHandler):
         
         # Delete bot
         try:
+            bot_repo = bot_repo or self.bot_repo
             if bot_repo:
                 await bot_repo.delete(bot_id)
             
-            await update.callback_query.edit_message_text(
+            await self.safe_edit(
+                update.callback_query,
                 "✅ Bot deleted successfully!"
             )
             
             # Show back to my bots
             await self.my_bots(update, context, bot_repo=bot_repo)
             
-            await self.log_action(user_id, "bot.deleted", "bot",
-                                resource_id=str(bot_id), status="success")
+            self.log_action(user_id, "bot.deleted", "bot",
+                          resource_id=str(bot_id), status="success")
         
         except Exception as e:
             logger.error(f"Error deleting bot {bot_id}: {e}")
             await update.callback_query.answer("❌ Error deleting bot", show_alert=True)
-            await self.log_action(user_id, "bot.delete_error", "bot",
-                                resource_id=str(bot_id), status="failure",
-                                error_code="DELETE_ERROR")
+            self.log_action(user_id, "bot.delete_error", "bot",
+                          resource_id=str(bot_id), status="failure",
+                          error_code="DELETE_ERROR")
@@ -1,28 +1,78 @@
 """User handlers for start, help, and basic commands."""
 
 import logging
+from functools import partial
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 
+from src.db.repository import gather_queries
 from src.telegram_handlers.base_handler import BaseHandler
 
 logger = logging.getLogger(__name__)
 
 
+# Static message texts
+_MAIN_MENU_TEXT = "🎮 <b>Main Menu</b>\n\nWhat would you like to do?"
+_HELP_TEXT = """
+🆘 <b>Help &amp; Information</b>
+
+<b>Commands:</b>
+• <code>/start</code> - Show main menu
+• <code>/help</code> - Show this message
+
+<b>Features:</b>
+🤖 <b>Upload Bot</b> - Upload your bot code directly
+📦 <b>GitHub Deploy</b> - Deploy from GitHub repository
+📂 <b>My Bots</b> - Manage your hosted bots
+⏱️ <b>Time Tracking</b> - Monitor remaining hosting time
+⚡ <b>Power System</b> - Track resource usage
+🛌 <b>Sleep Mode</b> - Auto sleep when resources depleted
+
+<b>Limits by Plan:</b>
+Free: 1 day, 30% power, 3 bots
+Pro: 7 days, 60% power, 10 bots
+Ultra: Unlimited
+
+<b>Need Help?</b>
+Contact: @support or use Feedback button
+"""
+
+# Static keyboards (PTB telegram objects are immutable, safe to share)
+_BACK_TO_MENU = (InlineKeyboardButton("🔙 Back to Menu", callback_data="main_menu"),)
+_HELP_KB = InlineKeyboardMarkup([_BACK_TO_MENU])
+_DASHBOARD_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📂 My Bots", callback_data="my_bots")],
+    _BACK_TO_MENU,
+])
+_MAIN_MENU_KB = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("➕ Upload Bot", callback_data="bot_upload"),
+        InlineKeyboardButton("🔁 GitHub Deploy", callback_data="bot_github"),
+    ],
+    [
+        InlineKeyboardButton("📂 My Bots", callback_data="my_bots"),
+        InlineKeyboardButton("📊 Dashboard", callback_data="dashboard"),
+    ],
+    [
+        InlineKeyboardButton("💬 Feedback", callback_data="feedback"),
+        InlineKeyboardButton("ℹ️ Help", callback_data="help"),
+    ],
+])
+
+
 class UserHandlers(BaseHandler):
     """Handle user-related commands and interactions."""
     
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
-                   user_repo=None, rate_limiter=None, audit_logger=None):
+                   user_repo=None, rate_limiter=None):
         """
         Handle /start command.
         
         Args:
             update: Telegram update
             context: Telegram context
-            user_repo: UserRepository instance
+            user_repo: UserRepository instance (defaults to self.user_repo)
             rate_limiter: RateLimiter instance
-            audit_logger: AuditLogger instance
         """
         user = update.effective_user
         user_id = user.id
@@ -36,6 +86,7 @@ class UserHandlers(BaseHandler):
             return
         
         # Check if user exists
+        user_repo = user_repo or self.user_repo
         if user_repo:
             existing_user = await user_repo.get_by_id(user_id)
             
@@ -49,19 +100,24 @@ class UserHandlers(BaseHandler):
                         "Please wait for approval before using features."
                     )
                     # Log new user signup
-                    await self.log_action(user_id, "user.signup", "user", status="success")
+                    self.log_action(user_id, "user.signup", "user", status="success")
                 except Exception as e:
                     logger.error(f"Error creating user {user_id}: {e}")
                     await update.message.reply_text("❌ Error creating account.")
-                    await self.log_action(user_id, "user.signup", "user", 
-                                        status="failure", error_code="DB_ERROR")
+                    self.log_action(user_id, "user.signup", "user", 
+                                  status="failure", error_code="DB_ERROR")
                     return
             
             # Check if user is approved
             if existing_user and existing_user.status != "approved":
                 if existing_user.status == "blocked":
                     await update.message.reply_text(
-                        f"❌ Your account is blocked.\nReason: {existing_user.blocked_reason}"
+                        f"❌ Your account is blocked.\nReason: {existing_user.blocked_reason}",
+                        parse_mode=None
+                    )
+                elif existing_user.status == "rejected":
+                    await update.message.reply_text(
+                        "❌ Your account application was rejected."
                     )
                 else:
                     await update.message.reply_text(
@@ -72,142 +128,85 @@ class UserHandlers(BaseHandler):
         
         # Show main menu
         await self.show_main_menu(update, context)
-        await self.log_action(user_id, "user.start", "user", status="success")
+        self.log_action(user_id, "user.start", "user", status="success")
     
     async def show_main_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show main menu to user."""
-        keyboard = [
-            [
-                InlineKeyboardButton("➕ Upload Bot", callback_data="bot_upload"),
-                InlineKeyboardButton("🔁 GitHub Deploy", callback_data="bot_github"),
-            ],
-            [
-                InlineKeyboardButton("📂 My Bots", callback_data="my_bots"),
-                InlineKeyboardButton("📊 Dashboard", callback_data="dashboard"),
-            ],
-            [
-                InlineKeyboardButton("💬 Feedback", callback_data="feedback"),
-                InlineKeyboardButton("ℹ️ Help", callback_data="help"),
-            ],
-        ]
-        
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
         if update.message:
             await update.message.reply_text(
-                "🎮 *Main Menu*\n\n"
-                "What would you like to do?",
-                reply_markup=reply_markup,
-                parse_mode="Markdown"
+                _MAIN_MENU_TEXT,
+                reply_markup=_MAIN_MENU_KB
             )
         elif update.callback_query:
-            await update.callback_query.edit_message_text(
-                "🎮 *Main Menu*\n\n"
-                "What would you like to do?",
-                reply_markup=reply_markup,
-                parse_mode="Markdown"
+            await self.safe_edit(
+                update.callback_query,
+                _MAIN_MENU_TEXT,
+                reply_markup=_MAIN_MENU_KB
             )
     
     async def help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show help message."""
-        help_text = """
-🆘 *Help & Information*
-
-*Commands:*
-• `/start` - Show main menu
-• `/help` - Show this message
-
-*Features:*
-🤖 *Upload Bot* - Upload your bot code directly
-📦 *GitHub Deploy* - Deploy from GitHub repository
-📂 *My Bots* - Manage your hosted bots
-⏱️ *Time Tracking* - Monitor remaining hosting time
-⚡ *Power System* - Track resource usage
-🛌 *Sleep Mode* - Auto sleep when resources depleted
-
-*Limits by Plan:*
-Free: 1 day, 30% power, 3 bots
-Pro: 7 days, 60% power, 10 bots
-Ultra: Unlimited
-
-*Need Help?*
-Contact: @support or use Feedback button
-"""
-        
-        keyboard = [
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="main_menu")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
         if update.callback_query:
-            await update.callback_query.edit_message_text(
-                help_text,
-                reply_markup=reply_markup,
-                parse_mode="Markdown"
+            await self.safe_edit(
+                update.callback_query,
+                _HELP_TEXT,
+                reply_markup=_HELP_KB
             )
         else:
             await update.message.reply_text(
-                help_text,
-                reply_markup=reply_markup,
-                parse_mode="Markdown"
+                _HELP_TEXT,
+                reply_markup=_HELP_KB
             )
     
     async def dashboard(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
                        user_repo=None, bot_repo=None):
         """Show user dashboard with stats."""
         user_id = update.effective_user.id
+        user_repo = user_repo or self.user_repo
+        bot_repo = bot_repo or self.bot_repo
         
-        # Get user info
-        user = None
-        if user_repo:
-            user = await user_repo.get_by_id(user_id)
-        
-        # Get user bots
-        bots = []
-        if bot_repo:
-            bots = await bot_repo.get_user_bots(user_id)
+        # Get user info and bot counts per status (together if sessions allow)
+        user, counts = await gather_queries(
+            partial(user_repo.get_by_id, user_id) if user_repo else None,
+            partial(bot_repo.get_status_counts, user_id) if bot_repo else None,
+        )
+        counts = counts or {}
         
         # Build dashboard
-        dashboard_text = "📊 *Your Dashboard*\n\n"
+        dashboard_text = "📊 <b>Your Dashboard</b>\n\n"
         
         if user:
-            dashboard_text += f"👤 *Account*\n"
-            dashboard_text += f"• Plan: `{user.plan}`\n"
-            dashboard_text += f"• Status: `{user.status}`\n"
-            dashboard_text += f"• Member since: `{user.joined_at.strftime('%Y-%m-%d')}`\n\n"
-        
-        dashboard_text += f"🤖 *Bots*\n"
-        dashboard_text += f"• Total: `{len(bots)}`\n"
+            dashboard_text += f"👤 <b>Account</b>\n"
+            dashboard_text += f"• Plan: <code>{user.plan}</code>\n"
+            dashboard_text += f"• Status: <code>{user.status}</code>\n"
+            dashboard_text += f"• Member since: <code>{user.joined_at.strftime('%Y-%m-%d')}</code>\n\n"
         
-        running = sum(1 for b in bots if b.status == "running")
-        sleeping = sum(1 for b in bots if b.status == "sleeping")
+        dashboard_text += f"🤖 <b>Bots</b>\n"
+        dashboard_text += f"• Total: <code>{sum(counts.values())}</code>\n"
         
-        dashboard_text += f"• Running: `{running}`\n"
-        dashboard_text += f"• Sleeping: `{sleeping}`\n"
+        running = counts.get("running", 0)
+        sleeping = counts.get("sleeping", 0)
         
-        keyboard = [
-            [InlineKeyboardButton("📂 My Bots", callback_data="my_bots")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="main_menu")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        dashboard_text += f"• Running: <code>{running}</code>\n"
+        dashboard_text += f"• Sleeping: <code>{sleeping}</code>\n"
         
         if update.callback_query:
-            await update.callback_query.edit_message_text(
+            await self.safe_edit(
+                update.callback_query,
                 dashboard_text,
-                reply_markup=reply_markup,
-                parse_mode="Markdown"
+                reply_markup=_DASHBOARD_KB
             )
         else:
             await update.message.reply_text(
                 dashboard_text,
-                reply_markup=reply_markup,
-                parse_mode="Markdown"
+                reply_markup=_DASHBOARD_KB
             )
     
     async def feedback_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Start feedback flow."""
-        await update.callback_query.edit_message_text(
-            "📝 *Send Feedback*\n\n"
+        await self.safe_edit(
+            update.callback_query,
+            "📝 <b>Send Feedback</b>\n\n"
             "Please share your feedback, suggestions, or report issues.\n"
             "Type your message and send:"
         )
@@ -215,8 +214,7 @@ Contact: @support or use Feedback button
         # Mark in context that we're waiting for feedback
         context.user_data['waiting_for_feedback'] = True
     
-    async def feedback_receive(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
-                             audit_logger=None):
+    async def feedback_receive(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Receive feedback message."""
         user_id = update.effective_user.id
         feedback_text = update.message.text
@@ -225,11 +223,10 @@ Contact: @support or use Feedback button
             return
         
         # Log feedback
-        if audit_logger:
-            await self.log_action(
-                user_id, "user.feedback", "user",
-                status="success", details={"feedback": feedback_text[:100]}
-            )
+        self.log_action(
+            user_id, "user.feedback", "user",
+            status="success", details={"feedback": feedback_text[:100]}
+        )
         
         context.user_data['waiting_for_feedback'] = False
         
@@ -1,11 +1,12 @@
 """Utils module initialization."""
 
 from src.utils.time_helpers import seconds_to_human, render_bar
-from src.utils.logger import setup_logging, JSONFormatter
+from src.utils.logger import setup_logging, shutdown_logging, JSONFormatter
 
 __all__ = [
     "seconds_to_human",
     "render_bar",
     "setup_logging",
+    "shutdown_logging",
     "JSONFormatter",
 ]
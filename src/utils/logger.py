@@ -2,15 +2,44 @@
 
 import logging
 import json
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+try:
+    import orjson
+    
+    def _dumps(data: dict) -> str:
+        return orjson.dumps(data).decode()
+except ImportError:
+    _dumps = json.dumps
+
+# Background thread that performs the actual console/file writes
+_listener: Optional[QueueListener] = None
 
 
 class JSONFormatter(logging.Formatter):
     """JSON structured logging formatter."""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Records arrive in bursts within the same second; only the
+        # microseconds change, so the second-level prefix is reused
+        self._ts_second = None
+        self._ts_prefix = ""
+    
+    def _timestamp(self, created: float) -> str:
+        """ISO-8601 UTC timestamp for a record's creation time."""
+        second = int(created)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = datetime.utcfromtimestamp(second).strftime("%Y-%m-%dT%H:%M:%S")
+        return f"{self._ts_prefix}.{int((created - second) * 1e6):06d}"
+    
     def format(self, record):
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -22,7 +51,19 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data)
+        return _dumps(log_data)
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that passes records through untouched.
+    
+    The queue never leaves the process, so the default prepare() (which
+    pre-formats the message and drops exc_info for pickling) is skipped;
+    JSONFormatter still sees exc_info on the listener thread.
+    """
+    
+    def prepare(self, record):
+        return record
 
 
 def setup_logging(level: str = "INFO", log_file: str = None):
@@ -34,6 +75,8 @@ def setup_logging(level: str = "INFO", log_file: str = None):
         log_file: Optional log file path
     """
     
+    global _listener
+    
     # Root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
@@ -41,15 +84,40 @@ def setup_logging(level: str = "INFO", log_file: str = None):
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (if specified)
     if log_file:
         try:
             file_handler = logging.FileHandler(log_file)
             file_handler.setFormatter(JSONFormatter())
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
             root_logger.warning(f"Could not setup file logging: {e}")
     
+    # Log calls only enqueue; formatting and blocking writes happen on the
+    # listener thread so they never stall the event loop
+    shutdown_logging()
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(_InProcessQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    
     return root_logger
+
+
+def shutdown_logging():
+    """Flush queued log records and stop the listener thread."""
+    global _listener
+    
+    if _listener is None:
+        return
+    
+    _listener.stop()
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, _InProcessQueueHandler):
+            root_logger.removeHandler(handler)
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
@@ -1,5 +1,7 @@
 """Time formatting utilities."""
 
+from functools import lru_cache
+
 
 def seconds_to_human(seconds: int) -> str:
     """
@@ -20,23 +22,23 @@ def seconds_to_human(seconds: int) -> str:
     if seconds is None or seconds < 0:
         return "0s"
     
-    seconds = int(seconds)
-    
-    days, remainder = divmod(seconds, 86400)
-    hours, remainder = divmod(remainder, 3600)
-    minutes, secs = divmod(remainder, 60)
-    
+    return _seconds_to_human_cached(int(seconds))
+
+
+_UNITS = ((86400, "d"), (3600, "h"), (60, "m"), (1, "s"))
+
+
+@lru_cache(maxsize=4096)
+def _seconds_to_human_cached(seconds: int) -> str:
+    """Format a non-negative int; memoized since list views repeat values."""
     parts = []
-    if days:
-        parts.append(f"{days}d")
-    if hours:
-        parts.append(f"{hours}h")
-    if minutes:
-        parts.append(f"{minutes}m")
-    if secs or not parts:
-        parts.append(f"{secs}s")
+    for size, suffix in _UNITS:
+        value = seconds // size
+        if value:
+            seconds -= value * size
+            parts.append(f"{value}{suffix}")
     
-    return " ".join(parts)
+    return " ".join(parts) or "0s"
 
 
 def render_bar(percent: float, length: int = 12) -> str:
@@ -59,8 +61,20 @@ def render_bar(percent: float, length: int = 12) -> str:
     except Exception:
         p = 0
     
+    if length == 12:
+        return _BAR_CACHE_12[p]
+    
+    return _build_bar(p, length)
+
+
+def _build_bar(p: int, length: int) -> str:
+    """Build the bar string for an already clamped integer percentage."""
     full = int((p / 100.0) * length)
     empty = length - full
     bar = "█" * full + "░" * empty
     
     return f"{bar} {p}%"
+
+
+# Every possible default-length bar, indexed by percentage
+_BAR_CACHE_12 = tuple(_build_bar(p, 12) for p in range(101))
@@ -0,0 +1,112 @@
+"""Tests for admin broadcast and user rejection."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.db.repository import UserRepository
+from src.services import UserService
+from src.telegram_handlers import AdminHandlers
+
+ADMIN_ID = 999
+
+
+class FakeMessage:
+    """Incoming message that records replies."""
+    
+    def __init__(self, text):
+        self.text = text
+        self.replies = []
+    
+    async def reply_text(self, text, **kwargs):
+        self.replies.append(text)
+
+
+class FakeBot:
+    """Bot that records sent messages."""
+    
+    def __init__(self):
+        self.sent = []
+    
+    async def send_message(self, chat_id, text, parse_mode=None):
+        self.sent.append((chat_id, text))
+
+
+class FakeUserRepo:
+    """UserRepository stand-in with a fixed set of approved users."""
+    
+    async def get_approved_user_ids(self):
+        return [1, 2]
+
+
+async def run_broadcast(text):
+    """Send `text` as the admin and return (message, bot)."""
+    message = FakeMessage(text)
+    bot = FakeBot()
+    update = SimpleNamespace(effective_user=SimpleNamespace(id=ADMIN_ID), message=message)
+    context = SimpleNamespace(args=text.split()[1:], application=SimpleNamespace(bot=bot))
+    
+    await AdminHandlers(ADMIN_ID).broadcast_message(update, context, user_repo=FakeUserRepo())
+    return message, bot
+
+
+@pytest.mark.asyncio
+async def test_broadcast_without_text_replies_usage():
+    """Test a bare /broadcast sends nothing and explains usage."""
+    message, bot = await run_broadcast("/broadcast")
+    
+    assert bot.sent == []
+    assert message.replies == ["Usage: /broadcast <message>"]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_sends_text_after_command():
+    """Test the text after the command reaches every approved user."""
+    message, bot = await run_broadcast("/broadcast Maintenance tonight\nBe ready")
+    
+    assert bot.sent == [(1, "Maintenance tonight\nBe ready"), (2, "Maintenance tonight\nBe ready")]
+    assert message.replies[0].startswith("✅ Broadcast sent to 2/2 users")
+
+
+@pytest.mark.asyncio
+async def test_reject_marks_user_rejected_and_revokes_cached_access(session_factory):
+    """Test rejecting stores 'rejected' (not 'blocked') and drops cached auth."""
+    class FakeQuery:
+        data = "admin_reject_1"
+        message = None
+        
+        async def answer(self, *args, **kwargs):
+            pass
+        
+        async def edit_message_text(self, *args, **kwargs):
+            pass
+    
+    async with session_factory() as session:
+        repo = UserRepository(session)
+        await repo.create(1, "someone", status="approved")
+        
+        handler = AdminHandlers(ADMIN_ID, user_repo=repo)
+        assert await handler.check_auth(1)
+        
+        update = SimpleNamespace(effective_user=SimpleNamespace(id=ADMIN_ID), callback_query=FakeQuery())
+        await handler.reject_user(update, SimpleNamespace(user_data={}))
+        
+        user = await repo.get_by_id(1)
+        assert (user.status, user.blocked_reason) == ("rejected", "Application rejected")
+        assert not await handler.check_auth(1)
+
+
+@pytest.mark.asyncio
+async def test_rejected_and_blocked_users_stay_distinguishable(session_factory):
+    """Test UserService records rejections and bans under different statuses."""
+    async with session_factory() as session:
+        repo = UserRepository(session)
+        await repo.create(1, "applicant")
+        await repo.create(2, "spammer", status="approved")
+        
+        service = UserService(repo)
+        assert (await service.reject_user(1, "incomplete", rejector_id=ADMIN_ID))["success"]
+        assert (await service.block_user(2, "spam", blocker_id=ADMIN_ID))["success"]
+        
+        assert (await repo.get_by_id(1)).status == "rejected"
+        assert (await repo.get_by_id(2)).status == "blocked"
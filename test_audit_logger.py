@@ -0,0 +1,95 @@
+"""Tests for batched audit logging."""
+
+import pytest
+from sqlalchemy import select, func
+
+from src.db.models import AuditLog, User
+from src.security import AuditLogger
+
+
+class RecordingAuditLogger(AuditLogger):
+    """AuditLogger that remembers the size of every batch it writes."""
+    
+    def __init__(self, session_factory):
+        super().__init__(session_factory)
+        self.batch_sizes = []
+    
+    async def _write_batch(self, batch):
+        self.batch_sizes.append(len(batch))
+        await super()._write_batch(batch)
+
+
+async def count_rows(session_factory, model) -> int:
+    """Count rows of model using a fresh session."""
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio
+async def test_enqueued_records_are_written_in_batches(session_factory):
+    """Test queued records are grouped into BATCH_SIZE inserts."""
+    audit = RecordingAuditLogger(session_factory)
+    
+    for i in range(120):
+        audit.enqueue(user_id=1, action="bot.started", status="success", resource_id=i)
+    await audit.close()
+    
+    assert audit.batch_sizes == [50, 50, 20]
+    assert await count_rows(session_factory, AuditLog) == 120
+    
+    async with session_factory() as session:
+        resource_id = await session.scalar(
+            select(AuditLog.resource_id).where(AuditLog.resource_id == "7")
+        )
+    assert resource_id == "7", "resource_id not stringified"
+
+
+@pytest.mark.asyncio
+async def test_enqueue_drops_records_when_queue_full(session_factory):
+    """Test records beyond QUEUE_MAXSIZE are counted and dropped."""
+    class SmallQueueAuditLogger(AuditLogger):
+        QUEUE_MAXSIZE = 3
+    
+    audit = SmallQueueAuditLogger(session_factory)
+    
+    for _ in range(5):
+        audit.enqueue(user_id=1, action="bot.started", status="success")
+    
+    assert audit.dropped == 2
+    
+    await audit.close()
+    assert await count_rows(session_factory, AuditLog) == 3
+
+
+@pytest.mark.asyncio
+async def test_close_drains_queue(session_factory):
+    """Test close() writes pending records and stops the flusher."""
+    audit = AuditLogger(session_factory)
+    
+    audit.enqueue(user_id=1, action="user.approved", status="success")
+    audit.log_action(user_id=2, action="user.rejected", status="success")
+    await audit.close()
+    
+    assert audit._queue.empty()
+    assert audit._flusher_task is None
+    assert await count_rows(session_factory, AuditLog) == 2
+    
+    # Closing twice (or without ever enqueuing) is a no-op
+    await audit.close()
+
+
+@pytest.mark.asyncio
+async def test_flusher_does_not_touch_request_session(session_factory):
+    """Test audit writes don't commit a request's pending work."""
+    audit = AuditLogger(session_factory)
+    
+    async with session_factory() as request_session:
+        request_session.add(User(id=1, username="pending_user"))
+        
+        audit.enqueue(user_id=1, action="bot.started", status="success")
+        await audit.close()
+        
+        await request_session.rollback()
+    
+    assert await count_rows(session_factory, AuditLog) == 1
+    assert await count_rows(session_factory, User) == 0
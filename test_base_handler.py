@@ -0,0 +1,212 @@
+"""Tests for BaseHandler caches, callback debouncing and message edits."""
+
+from types import SimpleNamespace
+
+import pytest
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import BadRequest
+
+from src.db.repository import UserRepository
+from src.services import UserService
+from src.telegram_handlers.base_handler import BaseHandler, security_handler
+
+ADMIN_ID = 999
+
+
+class FakeQuery:
+    """Callback query that records answers and edits."""
+    
+    def __init__(self, data="bot_manage_1", chat_id=10, message_id=20, edit_error=None):
+        self.data = data
+        self.message = SimpleNamespace(chat_id=chat_id, message_id=message_id)
+        self.edit_error = edit_error
+        self.answers = 0
+        self.edits = []
+    
+    async def answer(self, *args, **kwargs):
+        self.answers += 1
+    
+    async def edit_message_text(self, text, reply_markup=None, **kwargs):
+        if self.edit_error:
+            raise self.edit_error
+        self.edits.append(text)
+
+
+class CountingUserRepo:
+    """UserRepository stand-in that counts lookups."""
+    
+    def __init__(self, status="approved"):
+        self.status = status
+        self.lookups = 0
+    
+    async def get_by_id(self, user_id):
+        self.lookups += 1
+        return SimpleNamespace(id=user_id, status=self.status)
+
+
+def make_update(user_id=1, query=None):
+    """Build a minimal Update carrying a callback query."""
+    return SimpleNamespace(
+        effective_user=SimpleNamespace(id=user_id),
+        callback_query=query or FakeQuery(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_debounce_drops_rapid_repeat():
+    """Test a repeated press inside the window is answered and dropped."""
+    handler = BaseHandler(ADMIN_ID)
+    query = FakeQuery()
+    
+    assert not await handler._debounce_callback(make_update(query=query))
+    assert await handler._debounce_callback(make_update(query=query))
+    assert query.answers == 1
+    
+    # Other users and other buttons are tracked separately
+    assert not await handler._debounce_callback(make_update(user_id=2, query=query))
+    assert not await handler._debounce_callback(make_update(query=FakeQuery("bot_stop_1")))
+
+
+@pytest.mark.asyncio
+async def test_debounce_allows_press_after_window():
+    """Test a press after CALLBACK_DEBOUNCE seconds is handled again."""
+    handler = BaseHandler(ADMIN_ID)
+    handler.CALLBACK_DEBOUNCE = 0.0
+    query = FakeQuery()
+    
+    assert not await handler._debounce_callback(make_update(query=query))
+    assert not await handler._debounce_callback(make_update(query=query))
+
+
+@pytest.mark.asyncio
+async def test_safe_edit_skips_unchanged_content():
+    """Test identical text + keyboard is only sent once per message."""
+    handler = BaseHandler(ADMIN_ID)
+    query = FakeQuery()
+    markup = InlineKeyboardMarkup([[InlineKeyboardButton("🔙 Back", callback_data="main_menu")]])
+    
+    await handler.safe_edit(query, "Menu", reply_markup=markup)
+    await handler.safe_edit(query, "Menu", reply_markup=markup)
+    assert query.edits == ["Menu"]
+    
+    # A different keyboard or text is a real change
+    await handler.safe_edit(query, "Menu")
+    await handler.safe_edit(query, "Other", reply_markup=markup)
+    assert query.edits == ["Menu", "Menu", "Other"]
+
+
+@pytest.mark.asyncio
+async def test_safe_edit_ignores_not_modified_only():
+    """Test 'message is not modified' is swallowed, other errors raised."""
+    handler = BaseHandler(ADMIN_ID)
+    
+    not_modified = FakeQuery(edit_error=BadRequest("Message is not modified"))
+    await handler.safe_edit(not_modified, "Menu")
+    
+    broken = FakeQuery(message_id=21, edit_error=BadRequest("Message to edit not found"))
+    with pytest.raises(BadRequest):
+        await handler.safe_edit(broken, "Menu")
+
+
+@pytest.mark.asyncio
+async def test_check_auth_caches_status_until_invalidated():
+    """Test auth status is served from cache until invalidate() drops it."""
+    repo = CountingUserRepo()
+    handler = BaseHandler(ADMIN_ID, user_repo=repo)
+    
+    assert await handler.check_auth(1)
+    assert await handler.check_auth(1)
+    assert repo.lookups == 1
+    
+    repo.status = "blocked"
+    BaseHandler.invalidate(1)
+    assert not await handler.check_auth(1)
+    assert repo.lookups == 2
+
+
+@pytest.mark.asyncio
+async def test_auth_cache_is_lru_bounded():
+    """Test the least recently used user is evicted past AUTH_CACHE_MAX."""
+    handler = BaseHandler(ADMIN_ID, user_repo=CountingUserRepo())
+    handler.AUTH_CACHE_MAX = 2
+    
+    for user_id in (1, 2, 1, 3):
+        await handler.check_auth(user_id)
+    
+    assert list(BaseHandler._auth_cache) == [1, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("change", [
+    lambda service: service.block_user(1, "spam", blocker_id=ADMIN_ID),
+    lambda service: service.reject_user(1, "incomplete", rejector_id=ADMIN_ID),
+])
+async def test_user_service_status_change_revokes_cached_access(session_factory, change):
+    """Test blocking/rejecting through UserService takes effect immediately."""
+    async with session_factory() as session:
+        repo = UserRepository(session)
+        await repo.create(1, "someone", status="approved")
+        
+        handler = BaseHandler(ADMIN_ID, user_repo=repo)
+        assert await handler.check_auth(1)
+        
+        service = UserService(repo, invalidate_auth=BaseHandler.invalidate)
+        assert (await change(service))["success"]
+        assert not await handler.check_auth(1)
+
+
+@pytest.mark.asyncio
+async def test_user_service_approval_grants_access_immediately(session_factory):
+    """Test approving through UserService replaces a cached 'pending'."""
+    async with session_factory() as session:
+        repo = UserRepository(session)
+        await repo.create(1, "someone")
+        
+        handler = BaseHandler(ADMIN_ID, user_repo=repo)
+        assert not await handler.check_auth(1)
+        
+        service = UserService(repo, invalidate_auth=BaseHandler.invalidate)
+        assert (await service.approve_user(1, "free", approver_id=ADMIN_ID))["success"]
+        assert await handler.check_auth(1)
+
+
+@pytest.mark.asyncio
+async def test_security_handler_runs_enabled_checks():
+    """Test security_handler rejects non-admins and lets the admin through."""
+    class Handler(BaseHandler):
+        @security_handler(admin=True)
+        async def secret(self, update, context):
+            return "ran"
+    
+    class FakeMessage:
+        def __init__(self):
+            self.replies = []
+        
+        async def reply_text(self, text, **kwargs):
+            self.replies.append(text)
+    
+    handler = Handler(ADMIN_ID)
+    
+    user_update = SimpleNamespace(effective_user=SimpleNamespace(id=1), message=FakeMessage())
+    assert await handler.secret(user_update, None) is None
+    assert user_update.message.replies == ["❌ Admin only."]
+    
+    admin_update = SimpleNamespace(effective_user=SimpleNamespace(id=ADMIN_ID), message=FakeMessage())
+    assert await handler.secret(admin_update, None) == "ran"
+
+
+def test_log_action_queues_without_awaiting():
+    """Test log_action is a plain call that hands the record to enqueue()."""
+    class FakeAuditLogger:
+        def __init__(self):
+            self.records = []
+        
+        def enqueue(self, **record):
+            self.records.append(record)
+    
+    audit = FakeAuditLogger()
+    assert BaseHandler(ADMIN_ID, audit_logger=audit).log_action(1, "bot.deleted", "bot") is None
+    assert [r["action"] for r in audit.records] == ["bot.deleted"]
+    
+    # Without an audit logger it is a no-op
+    BaseHandler(ADMIN_ID).log_action(1, "bot.deleted", "bot")
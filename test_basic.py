@@ -55,6 +55,11 @@ def test_input_validator():
     assert not validator.validate_username("abc"), "Too short username accepted"
     assert not validator.validate_github_url("http://github.com/user/repo"), "HTTP URL accepted"
     
+    # Token extraction
+    token = "123456789:" + "A" * 35
+    assert validator.extract_bot_token(f'TOKEN = "{token}"') == token, "Token not extracted"
+    assert validator.extract_bot_token("no token here") == "", "Bogus token extracted"
+    
     print("✅ Input validator works correctly")
 
 
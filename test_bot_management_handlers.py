@@ -0,0 +1,89 @@
+"""Tests for the paginated my_bots list."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.db.repository import BotRepository
+from src.telegram_handlers import BotManagementHandlers
+
+
+class FakeQuery:
+    """Callback query that keeps the last edited keyboard."""
+    
+    def __init__(self, data):
+        self.data = data
+        self.message = None
+        self.text = None
+        self.keyboard = None
+    
+    async def answer(self, *args, **kwargs):
+        pass
+    
+    async def edit_message_text(self, text, reply_markup=None, **kwargs):
+        self.text = text
+        self.keyboard = reply_markup.inline_keyboard
+
+
+async def show_my_bots(session_factory, data):
+    """
+    Render my_bots for user 1 (the admin passes auth) and return the query.
+    
+    The handler is called the way PTB calls it, with only (update, context),
+    so the repository bound at construction must be used.
+    """
+    query = FakeQuery(data)
+    update = SimpleNamespace(effective_user=SimpleNamespace(id=1), callback_query=query)
+    
+    async with session_factory() as session:
+        handler = BotManagementHandlers(admin_id=1, bot_repo=BotRepository(session))
+        await handler.my_bots(update, None)
+    return query
+
+
+def button_data(query):
+    """Flatten the keyboard to its callback data."""
+    return [button.callback_data for row in query.keyboard for button in row]
+
+
+@pytest.mark.asyncio
+async def test_my_bots_pages(session_factory, add_bot):
+    """Test 10 bots split into a full first page and a 2-bot second page."""
+    for i in range(10):
+        await add_bot(name=f"bot{i}")
+    
+    first = button_data(await show_my_bots(session_factory, "my_bots"))
+    assert sum(data.startswith("bot_manage_") for data in first) == 8
+    assert "my_bots_p1" in first and "my_bots_p0" not in first
+    
+    second = button_data(await show_my_bots(session_factory, "my_bots_p1"))
+    assert sum(data.startswith("bot_manage_") for data in second) == 2
+    assert "my_bots_p0" in second and "my_bots_p2" not in second
+
+
+@pytest.mark.asyncio
+async def test_my_bots_clamps_page_past_end(session_factory, add_bot):
+    """Test a page beyond the last one shows the last page, not an empty list."""
+    for i in range(10):
+        await add_bot(name=f"bot{i}")
+    
+    buttons = button_data(await show_my_bots(session_factory, "my_bots_p7"))
+    assert sum(data.startswith("bot_manage_") for data in buttons) == 2
+    assert "my_bots_p0" in buttons
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("data", ["my_bots_pX", "my_bots_p", "my_bots_p-3"])
+async def test_my_bots_malformed_page_is_first_page(session_factory, add_bot, data):
+    """Test malformed or negative page numbers fall back to page 0."""
+    await add_bot()
+    
+    query = await show_my_bots(session_factory, data)
+    assert sum(d.startswith("bot_manage_") for d in button_data(query)) == 1
+
+
+@pytest.mark.asyncio
+async def test_my_bots_past_end_without_bots_shows_empty_state(session_factory):
+    """Test a stale page link for a user with no bots shows 'no bots'."""
+    query = await show_my_bots(session_factory, "my_bots_p3")
+    assert "You don't have any bots yet" in query.text
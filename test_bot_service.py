@@ -0,0 +1,127 @@
+"""Tests for BotService start/stop/delete lifecycle."""
+
+import pytest
+
+from src.db.repository import BotRepository
+from src.services import BotService
+
+
+class FakeContainerManager:
+    """Records container launches and stops instead of talking to Docker."""
+    
+    def __init__(self):
+        self.launched = []
+        self.stopped = []
+    
+    def launch_bot_container(self, bot_id, bot_token, timeout_seconds):
+        self.launched.append(bot_id)
+        return f"container-{bot_id}"
+    
+    def stop_bot_container(self, bot_id):
+        self.stopped.append(bot_id)
+
+
+class FailingRunningRepository(BotRepository):
+    """BotRepository whose transition to 'running' fails."""
+    
+    async def mark_running(self, bot_id, container_id=None):
+        raise RuntimeError("database went away")
+
+
+class DeletedWhileStartingRepository(BotRepository):
+    """BotRepository whose bot is deleted right after it is claimed."""
+    
+    def __init__(self, session, session_factory):
+        super().__init__(session)
+        self.session_factory = session_factory
+    
+    async def reserve_for_start(self, bot_id, user_id):
+        bot = await super().reserve_for_start(bot_id, user_id)
+        async with self.session_factory() as other:
+            assert await BotRepository(other).delete_owned(bot_id, user_id)
+        return bot
+
+
+async def get_status(session_factory, bot_id):
+    """Read a bot's status with a fresh session."""
+    async with session_factory() as session:
+        return (await BotRepository(session).get_by_id(bot_id)).status
+
+
+@pytest.mark.asyncio
+async def test_start_and_stop(session_factory, add_bot):
+    """Test a bot can be started, then stopped, and not stopped twice."""
+    bot_id = await add_bot()
+    manager = FakeContainerManager()
+    
+    async with session_factory() as session:
+        service = BotService(BotRepository(session), container_manager=manager)
+        
+        assert (await service.start_bot(bot_id, user_id=1))["success"]
+        assert (await service.start_bot(bot_id, user_id=1))["error"] == "Bot is already running"
+        
+        assert (await service.stop_bot(bot_id, user_id=1))["success"]
+        assert (await service.stop_bot(bot_id, user_id=1))["error"] == "Bot is not running"
+    
+    assert manager.launched == [bot_id]
+    assert manager.stopped == [bot_id]
+    assert await get_status(session_factory, bot_id) == "stopped"
+
+
+@pytest.mark.asyncio
+async def test_start_releases_claim_on_failure(session_factory, add_bot):
+    """Test a failure after launching stops the container and frees the bot."""
+    bot_id = await add_bot()
+    manager = FakeContainerManager()
+    
+    async with session_factory() as session:
+        service = BotService(FailingRunningRepository(session), container_manager=manager)
+        result = await service.start_bot(bot_id, user_id=1)
+    
+    assert not result["success"]
+    assert manager.stopped == [bot_id], "Launched container left running"
+    assert await get_status(session_factory, bot_id) == "stopped"
+
+
+@pytest.mark.asyncio
+async def test_start_stops_container_of_bot_deleted_mid_start(session_factory, add_bot):
+    """Test a delete during 'starting' doesn't leave an orphaned container."""
+    bot_id = await add_bot()
+    manager = FakeContainerManager()
+    
+    async with session_factory() as session:
+        repo = DeletedWhileStartingRepository(session, session_factory)
+        result = await BotService(repo, container_manager=manager).start_bot(bot_id, user_id=1)
+        
+        assert result["error"] == "Bot was deleted while starting"
+        assert await repo.get_by_id(bot_id) is None
+    
+    assert manager.launched == [bot_id]
+    assert manager.stopped == [bot_id], "Launched container left running"
+
+
+@pytest.mark.asyncio
+async def test_start_denied_while_stopping(session_factory, add_bot):
+    """Test a bot being stopped can't be claimed by a start."""
+    bot_id = await add_bot(status="stopping")
+    
+    async with session_factory() as session:
+        service = BotService(BotRepository(session), container_manager=FakeContainerManager())
+        result = await service.start_bot(bot_id, user_id=1)
+    
+    assert result["error"] == "Bot is stopping"
+    assert await get_status(session_factory, bot_id) == "stopping"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", ["starting", "running", "stopping"])
+async def test_delete_stops_active_container(session_factory, add_bot, status):
+    """Test deleting a bot mid-start/stop still stops its container."""
+    bot_id = await add_bot(status=status)
+    manager = FakeContainerManager()
+    
+    async with session_factory() as session:
+        service = BotService(BotRepository(session), container_manager=manager)
+        assert (await service.delete_bot(bot_id, user_id=1))["success"]
+    
+    assert manager.stopped == [bot_id]
@@ -0,0 +1,67 @@
+"""Tests for NotificationService broadcast pacing and flood control."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from telegram.error import RetryAfter
+
+from src.services import NotificationService
+
+
+class FakeBot:
+    """Bot whose send_message records the time of each successful send."""
+    
+    def __init__(self, flood_once=(), fail=()):
+        self.flood_once = set(flood_once)
+        self.fail = set(fail)
+        self.sent = []
+    
+    async def send_message(self, chat_id, text, parse_mode=None):
+        if chat_id in self.flood_once:
+            self.flood_once.discard(chat_id)
+            raise RetryAfter(0)
+        if chat_id in self.fail:
+            raise RuntimeError("chat not found")
+        self.sent.append((chat_id, asyncio.get_running_loop().time()))
+
+
+def make_service(bot, rate=1000):
+    """NotificationService around a fake bot, with a configurable send rate."""
+    service = NotificationService(SimpleNamespace(bot=bot))
+    service.BROADCAST_RATE = rate
+    return service
+
+
+@pytest.mark.asyncio
+async def test_broadcast_retries_after_flood_control():
+    """Test RetryAfter is waited out and the message still delivered."""
+    bot = FakeBot(flood_once={2}, fail={3})
+    results = await make_service(bot).broadcast([1, 2, 3], "hello", parse_mode=None)
+    
+    assert sorted(chat_id for chat_id, _ in bot.sent) == [1, 2]
+    assert (results["sent"], results["failed"]) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_gives_up_after_max_retries():
+    """Test a chat that keeps hitting flood control is counted as failed."""
+    class AlwaysFlooded(FakeBot):
+        async def send_message(self, chat_id, text, parse_mode=None):
+            raise RetryAfter(0)
+    
+    service = make_service(AlwaysFlooded())
+    service.MAX_FLOOD_RETRIES = 2
+    results = await service.broadcast([1], "hello")
+    
+    assert results["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_paces_sends():
+    """Test sends start no faster than BROADCAST_RATE per second."""
+    bot = FakeBot()
+    await make_service(bot, rate=20).broadcast(list(range(5)), "hello")
+    
+    times = [sent_at for _, sent_at in bot.sent]
+    assert times[-1] - times[0] >= 4 / 20 * 0.9
@@ -0,0 +1,186 @@
+"""Tests for conditional bot updates and deletes in BotRepository, and gather_queries."""
+
+from functools import partial
+
+import pytest
+
+from src.db.repository import BotRepository, UserRepository, gather_queries
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", ["stopped", "sleeping"])
+async def test_reserve_for_start_claims_idle_bot(session_factory, add_bot, status):
+    """Test an owned, idle bot with time and power is claimed as 'starting'."""
+    bot_id = await add_bot(status=status)
+    
+    async with session_factory() as session:
+        bot = await BotRepository(session).reserve_for_start(bot_id, user_id=1)
+    
+    assert bot is not None and bot.id == bot_id
+    assert bot.status == "starting"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", ["starting", "running", "stopping"])
+async def test_reserve_for_start_refuses_active_bot(session_factory, add_bot, status):
+    """Test a bot that is starting, running or stopping can't be claimed."""
+    bot_id = await add_bot(status=status)
+    
+    async with session_factory() as session:
+        repo = BotRepository(session)
+        assert await repo.reserve_for_start(bot_id, user_id=1) is None
+        assert (await repo.get_by_id(bot_id)).status == status
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fields", [
+    {"user_id": 2},
+    {"remaining_seconds": 0},
+    {"power_remaining": 0.0},
+])
+async def test_reserve_for_start_refuses_unowned_or_exhausted(session_factory, add_bot, fields):
+    """Test ownership, time and power are checked in the same UPDATE."""
+    bot_id = await add_bot(**fields)
+    
+    async with session_factory() as session:
+        assert await BotRepository(session).reserve_for_start(bot_id, user_id=1) is None
+
+
+@pytest.mark.asyncio
+async def test_reserve_for_start_only_one_claim_wins(session_factory, add_bot):
+    """Test two starts from separate sessions claim the bot only once."""
+    bot_id = await add_bot()
+    
+    async with session_factory() as first, session_factory() as second:
+        claims = [
+            await BotRepository(first).reserve_for_start(bot_id, user_id=1),
+            await BotRepository(second).reserve_for_start(bot_id, user_id=1),
+        ]
+    
+    assert sum(claim is not None for claim in claims) == 1
+
+
+@pytest.mark.asyncio
+async def test_reserve_for_stop_claims_running_bot(session_factory, add_bot):
+    """Test a running bot is claimed as 'stopping' with its container_id."""
+    bot_id = await add_bot(status="running", container_id="abc123")
+    
+    async with session_factory() as session:
+        bot = await BotRepository(session).reserve_for_stop(bot_id, user_id=1)
+    
+    assert bot.status == "stopping"
+    assert bot.container_id == "abc123"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", ["stopped", "starting", "stopping"])
+async def test_reserve_for_stop_refuses_non_running_bot(session_factory, add_bot, status):
+    """Test only running bots can be claimed for stopping."""
+    bot_id = await add_bot(status=status)
+    
+    async with session_factory() as session:
+        assert await BotRepository(session).reserve_for_stop(bot_id, user_id=1) is None
+
+
+@pytest.mark.asyncio
+async def test_reserve_for_stop_refuses_unowned_bot(session_factory, add_bot):
+    """Test another user's running bot can't be claimed."""
+    bot_id = await add_bot(user_id=2, status="running")
+    
+    async with session_factory() as session:
+        assert await BotRepository(session).reserve_for_stop(bot_id, user_id=1) is None
+
+
+@pytest.mark.asyncio
+async def test_mark_running_finishes_start(session_factory, add_bot):
+    """Test a 'starting' bot becomes running with its container ID."""
+    bot_id = await add_bot(status="starting")
+    
+    async with session_factory() as session:
+        repo = BotRepository(session)
+        assert await repo.mark_running(bot_id, "abc123")
+        bot = await repo.get_by_id(bot_id)
+    
+    assert (bot.status, bot.container_id) == ("running", "abc123")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", ["stopped", "running", "stopping"])
+async def test_mark_running_refuses_bot_not_starting(session_factory, add_bot, status):
+    """Test only a bot still in 'starting' is marked running."""
+    bot_id = await add_bot(status=status)
+    
+    async with session_factory() as session:
+        repo = BotRepository(session)
+        assert not await repo.mark_running(bot_id, "abc123")
+        assert not await repo.mark_running(bot_id + 1, "abc123")
+        assert (await repo.get_by_id(bot_id)).status == status
+
+
+@pytest.mark.asyncio
+async def test_update_status_sets_container_id(session_factory, add_bot):
+    """Test update_status writes status and container_id together."""
+    bot_id = await add_bot(status="starting")
+    
+    async with session_factory() as session:
+        await BotRepository(session).update_status(bot_id, "running", "abc123")
+    
+    async with session_factory() as session:
+        bot = await BotRepository(session).get_by_id(bot_id)
+    
+    assert (bot.status, bot.container_id) == ("running", "abc123")
+
+
+@pytest.mark.asyncio
+async def test_delete_owned_returns_last_state(session_factory, add_bot):
+    """Test delete_owned removes the bot and returns its status/container."""
+    bot_id = await add_bot(status="running", container_id="abc123")
+    
+    async with session_factory() as session:
+        repo = BotRepository(session)
+        row = await repo.delete_owned(bot_id, user_id=1)
+        
+        assert (row.status, row.container_id) == ("running", "abc123")
+        assert await repo.get_by_id(bot_id) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_owned_refuses_unowned_bot(session_factory, add_bot):
+    """Test another user's bot is neither deleted nor reported."""
+    bot_id = await add_bot(user_id=2)
+    
+    async with session_factory() as session:
+        repo = BotRepository(session)
+        assert await repo.delete_owned(bot_id, user_id=1) is None
+        assert await repo.get_by_id(bot_id) is not None
+
+
+@pytest.mark.asyncio
+async def test_gather_queries_shared_session_runs_in_order(session_factory, add_bot):
+    """Test calls on one AsyncSession don't overlap (which would deadlock)."""
+    await add_bot(status="running")
+    
+    async with session_factory() as session:
+        user, counts, missing = await gather_queries(
+            partial(UserRepository(session).get_by_id, 1),
+            partial(BotRepository(session).get_status_counts, 1),
+            None,
+        )
+    
+    assert user.id == 1
+    assert counts == {"running": 1}
+    assert missing is None
+
+
+@pytest.mark.asyncio
+async def test_gather_queries_separate_sessions(session_factory, add_bot):
+    """Test calls on different sessions return results in call order."""
+    bot_id = await add_bot()
+    
+    async with session_factory() as s1, session_factory() as s2:
+        bot, user = await gather_queries(
+            partial(BotRepository(s1).get_by_id, bot_id),
+            partial(UserRepository(s2).get_by_id, 1),
+        )
+    
+    assert (bot.id, user.id) == (bot_id, 1)
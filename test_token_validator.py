@@ -0,0 +1,72 @@
+"""Tests for the TelegramTokenValidator result cache."""
+
+import pytest
+
+from src.security import TelegramTokenValidator
+
+TOKEN = "123456789:" + "A" * 35
+
+
+class FakeResponse:
+    """getMe response with a fixed JSON body."""
+    
+    status = 200
+    
+    def __init__(self, body):
+        self.body = body
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    async def json(self):
+        return self.body
+
+
+class FakeSession:
+    """HTTP session that answers getMe from a queue and counts calls."""
+    
+    closed = False
+    
+    def __init__(self, *bodies):
+        self.bodies = list(bodies)
+        self.calls = 0
+    
+    def get(self, url, timeout=None):
+        self.calls += 1
+        return FakeResponse(self.bodies.pop(0))
+
+
+ACCEPTED = {"ok": True, "result": {"is_bot": True, "username": "test_bot"}}
+REVOKED = {"ok": False, "description": "Unauthorized"}
+
+
+def make_validator(session):
+    """Validator that talks to `session` instead of Telegram."""
+    validator = TelegramTokenValidator()
+    validator._session = session
+    return validator
+
+
+@pytest.mark.asyncio
+async def test_accepted_token_is_rechecked_and_revocation_seen():
+    """Test a valid result isn't cached, so a revoked token fails at once."""
+    session = FakeSession(ACCEPTED, REVOKED)
+    validator = make_validator(session)
+    
+    assert await validator.validate_token(TOKEN) == (True, "")
+    assert await validator.validate_token(TOKEN) == (False, "Invalid token: Unauthorized")
+    assert session.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_is_cached():
+    """Test a rejection is answered from cache within CACHE_TTL."""
+    session = FakeSession(REVOKED)
+    validator = make_validator(session)
+    
+    for _ in range(2):
+        assert await validator.validate_token(TOKEN) == (False, "Invalid token: Unauthorized")
+    assert session.calls == 1
@@ -0,0 +1,76 @@
+"""Tests for /start and the dashboard as PTB calls them."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.db.repository import BotRepository, UserRepository
+from src.telegram_handlers import UserHandlers
+
+ADMIN_ID = 999
+
+
+class FakeMessage:
+    """Incoming message that records replies."""
+    
+    def __init__(self):
+        self.replies = []
+    
+    async def reply_text(self, text, **kwargs):
+        self.replies.append(text)
+
+
+async def run_start(repo, user_id=1):
+    """Call /start with only (update, context) and return the replies."""
+    message = FakeMessage()
+    update = SimpleNamespace(
+        effective_user=SimpleNamespace(id=user_id, username="someone"),
+        message=message,
+    )
+    
+    await UserHandlers(ADMIN_ID, user_repo=repo).start(update, None)
+    return message.replies
+
+
+@pytest.mark.asyncio
+async def test_start_registers_new_user_with_bound_repo(session_factory):
+    """Test /start uses the handler's UserRepository to sign up a new user."""
+    async with session_factory() as session:
+        repo = UserRepository(session)
+        replies = await run_start(repo)
+        
+        assert (await repo.get_by_id(1)).status == "pending"
+    assert "pending admin approval" in replies[0]
+
+
+@pytest.mark.asyncio
+async def test_start_tells_rejected_user(session_factory):
+    """Test a rejected applicant is told so, not that approval is pending."""
+    async with session_factory() as session:
+        repo = UserRepository(session)
+        await repo.create(1, "someone", status="rejected")
+        replies = await run_start(repo)
+    
+    assert replies == ["❌ Your account application was rejected."]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_with_repos_on_one_session(session_factory, add_bot):
+    """Test the dashboard reads user and bot counts through a shared session."""
+    await add_bot(status="running")
+    await add_bot(status="stopped")
+    message = FakeMessage()
+    update = SimpleNamespace(
+        effective_user=SimpleNamespace(id=1),
+        callback_query=None,
+        message=message,
+    )
+    
+    async with session_factory() as session:
+        handler = UserHandlers(ADMIN_ID, user_repo=UserRepository(session),
+                               bot_repo=BotRepository(session))
+        await handler.dashboard(update, None)
+    
+    assert "Plan: <code>free</code>" in message.replies[0]
+    assert "Total: <code>2</code>" in message.replies[0]
+    assert "Running: <code>1</code>" in message.replies[0]